@@ -10,29 +10,34 @@ It provides a command-line interface to initiate the analysis and includes
 debugging information for flow orchestration.
 
 Classes:
-    CryptoState: State container for the cryptocurrency analysis flow.
-    CryptoFlow: Main flow orchestrator for financial analysis.
+    FinwizState: State container for the financial analysis flow.
+    FinwizFlow: Main flow orchestrator for financial analysis.
 
 Functions:
     kickoff: Initialize and start the main FinWiz analysis flow.
+    kickoff_many: Run several FinWiz analysis flows in parallel processes.
+    kickoff_batch: Command-line wrapper around kickoff_many.
     plot: Initialize the FinWiz analysis flow and plot its structure.
 """
 
+from __future__ import annotations
+
+import json
 import logging
 import os
+import sys
 import warnings
-from datetime import datetime
+from concurrent.futures import ProcessPoolExecutor
+from functools import cached_property
 from typing import Any
 
+from crewai import Crew
 from crewai.flow import Flow, and_, listen, start
 from dotenv import load_dotenv
 
-from finwiz.crews.crypto_crew.crypto_crew import CryptoCrew
-from finwiz.crews.etf_crew.etf_crew import EtfCrew
-from finwiz.crews.report_crew.report_crew import ReportCrew
-from finwiz.crews.stock_crew.stock_crew import StockCrew
 from finwiz.tools.crewai_retry_patch import initialize_retry_mechanism
 from finwiz.tools.logger import get_logger, setup_logging
+from finwiz.utils.flow_utils import build_flow_inputs
 # from finwiz.utils.flow_utils import get_output_dir, run_crew_with_caching
 
 # Setup logging configuration
@@ -51,14 +56,18 @@ warnings.filterwarnings("ignore", message="No path_separator found in configurat
 logger.info("Loading environment variables")
 load_dotenv()
 
-# Initialize LLM retry mechanism with 5 max retries and longer timeout
+# Initialize LLM retry mechanism, by default with 5 max retries and a
+# 5 minute timeout
 logger.info("Initializing LLM retry mechanism with extended timeout")
-initialize_retry_mechanism(max_retries=5, timeout=300)  # 5 minute timeout
+initialize_retry_mechanism(
+    max_retries=int(os.getenv("FINWIZ_LLM_MAX_RETRIES", "5")),
+    timeout=int(os.getenv("FINWIZ_LLM_TIMEOUT", "300")),
+)
 logger.debug("Environment variables loaded")
 
 
 class FinwizState:
-    """Represents the state for the cryptocurrency analysis flow."""
+    """Represents the state for the financial analysis flow."""
 
     etf_result: str = ""
     crypto_result: str = ""
@@ -80,39 +89,77 @@ class FinwizFlow(Flow[FinwizState]):
         super().__init__(*args, **kwargs)
 
         # Create inputs at instance level
-        today = datetime.now()
-        self.inputs = {
-            "current_day": today.day,
-            "current_month": today.month,
-            "current_year": today.year,
-            "current_date": today.strftime("%Y-%m-%d"),
-            "full_date": today.strftime("%B %d, %Y"),
-            "timestamp": today.strftime("%Y-%m-%d %H:%M:%S"),
-        }
-        logger.debug(f"Flow inputs prepared with timestamp: {self.inputs['timestamp']}")
+        self.inputs = build_flow_inputs()
+        logger.debug(
+            "Flow inputs prepared with timestamp: %s", self.inputs["timestamp"]
+        )
 
     # Utility methods moved to flow_utils.py
 
+    # Crews are built on first use and kept for the lifetime of the flow. Their
+    # modules are imported lazily: they build their tools at import time,
+    # which plot() never needs.
+
+    @cached_property
+    def _crypto_crew(self) -> Crew:
+        """Cryptocurrency analysis crew."""
+        from finwiz.crews.crypto_crew.crypto_crew import CryptoCrew
+
+        return CryptoCrew().crew()
+
+    @cached_property
+    def _stock_crew(self) -> Crew:
+        """Stock analysis crew."""
+        from finwiz.crews.stock_crew.stock_crew import StockCrew
+
+        return StockCrew().crew()
+
+    @cached_property
+    def _etf_crew(self) -> Crew:
+        """ETF analysis crew."""
+        from finwiz.crews.etf_crew.etf_crew import EtfCrew
+
+        return EtfCrew().crew()
+
+    @cached_property
+    def _report_crew(self) -> Crew:
+        """Consolidated report crew."""
+        from finwiz.crews.report_crew.report_crew import ReportCrew
+
+        return ReportCrew().crew()
+
+    # The start steps are coroutines so the Flow runs the three crews
+    # concurrently; a synchronous kickoff() would block the event loop.
+
     @start()
-    def check_crypto(self) -> None:
+    async def check_crypto(self) -> None:
         """Initiate the cryptocurrency analysis crew."""
-        CryptoCrew().crew().kickoff(inputs=self.inputs)
+        result = await self._crypto_crew.kickoff_async(inputs=self.inputs)
+        self.state.crypto_result = result.raw
 
     @start()
-    def check_stock(self) -> None:
+    async def check_stock(self) -> None:
         """Initiate the stock analysis crew."""
-        StockCrew().crew().kickoff(inputs=self.inputs)
+        result = await self._stock_crew.kickoff_async(inputs=self.inputs)
+        self.state.stock_result = result.raw
 
     @start()
-    def check_etf(self) -> None:
+    async def check_etf(self) -> None:
         """Initiate the ETF analysis crew."""
-        EtfCrew().crew().kickoff(inputs=self.inputs)
+        result = await self._etf_crew.kickoff_async(inputs=self.inputs)
+        self.state.etf_result = result.raw
 
     @listen(and_(check_stock, check_etf, check_crypto))
-    def report(self) -> None:
-        """Generate a consolidated report after all analyses are complete."""
-        ReportCrew().crew().kickoff(inputs=self.inputs)
-       
+    def report(self) -> str:
+        """
+        Generate a consolidated report after all analyses are complete.
+
+        Returns:
+            str: The raw output of the report crew, used as the flow result.
+        """
+        result = self._report_crew.kickoff(inputs=self.inputs)
+        return result.raw
+
 
 def kickoff() -> None:
     """Initialize and start the main FinWiz analysis flow."""
@@ -123,10 +170,61 @@ def kickoff() -> None:
         finwiz_flow.kickoff()
         logger.info("FinWiz analysis workflow completed successfully")
     except Exception as e:
-        logger.critical(f"FinWiz analysis workflow failed: {str(e)}", exc_info=True)
+        logger.critical("FinWiz analysis workflow failed: %s", e, exc_info=True)
         raise
 
 
+def _run_one(inputs: dict[str, Any]) -> str:
+    """
+    Run a single FinwizFlow in a worker process.
+
+    Args:
+        inputs: Values overriding the default flow inputs (e.g. "full_date")
+
+    Returns:
+        str: The raw consolidated report returned by the flow's last step.
+    """
+    finwiz_flow = FinwizFlow(state=FinwizState())
+    finwiz_flow.inputs.update(inputs)
+    return finwiz_flow.kickoff()
+
+
+def kickoff_many(
+    input_rows: list[dict[str, Any]], max_workers: int | None = None
+) -> list[str]:
+    """
+    Run one FinWiz analysis flow per input row in a process pool.
+
+    Each process owns its own LLM clients and interpreter, so batch runs
+    (e.g. backtests over several dates) scale with the number of cores.
+    Crew outputs are named after "full_date", so rows should use distinct
+    dates to avoid overwriting each other's reports.
+
+    Args:
+        input_rows: Input overrides, one dict per flow run
+        max_workers: Number of worker processes (default: CPU count)
+
+    Returns:
+        list[str]: The raw consolidated report of each flow, in the order of
+        `input_rows`.
+    """
+    logger.info("Starting %d FinWiz analysis workflows", len(input_rows))
+    with ProcessPoolExecutor(max_workers=max_workers) as executor:
+        results = list(executor.map(_run_one, input_rows))
+    logger.info("All %d FinWiz analysis workflows completed", len(input_rows))
+    return results
+
+
+def kickoff_batch() -> None:
+    """Run kickoff_many on the JSON list of input overrides given as argument."""
+    if len(sys.argv) != 2:
+        sys.exit("Usage: kickoff_batch <inputs.json>")
+
+    with open(sys.argv[1], encoding="utf-8") as f:
+        input_rows = json.load(f)
+    kickoff_many(input_rows)
+
+
 def plot() -> None:
     """Initialize the FinWiz analysis flow and plot its structure."""
     logger.info("Plotting FinWiz analysis flow structure")
@@ -135,7 +233,7 @@ def plot() -> None:
         finwiz_flow.plot()
         logger.info("Flow structure plotting completed")
     except Exception as e:
-        logger.error(f"Error plotting flow structure: {str(e)}", exc_info=True)
+        logger.error("Error plotting flow structure: %s", e, exc_info=True)
         raise
 
 
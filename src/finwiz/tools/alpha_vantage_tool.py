@@ -6,22 +6,236 @@ comprehensive financial data, including fundamental data, technical indicators,
 and more.
 """
 
-import json
 import os
+import random
+import threading
+import time
+from concurrent.futures import Future, ThreadPoolExecutor
 from typing import Type
 
+import orjson
 import requests
 from crewai.tools import BaseTool
 from dotenv import load_dotenv
 from pydantic import BaseModel, Field
 
-load_dotenv()
+from finwiz.tools.logger import get_logger
+from finwiz.utils.cache_utils import get_cached, set_cached
+from finwiz.utils.http_utils import DEFAULT_TIMEOUT, create_session
+
+logger = get_logger(__name__)
+
+# Only read .env when the entry point has not already loaded the key
+if not os.getenv("ALPHA_VANTAGE_API_KEY"):
+    load_dotenv()
+
+# Resolved once at import rather than on every call
+_API_KEY = os.getenv("ALPHA_VANTAGE_API_KEY")
+_MISSING_KEY_ERROR = "Error: ALPHA_VANTAGE_API_KEY environment variable not set."
+_OVERVIEW_URL_TEMPLATE = (
+    "https://www.alphavantage.co/query?function=OVERVIEW&symbol={}"
+    f"&apikey={_API_KEY}"
+)
+
+# Shared session so repeated lookups reuse pooled keep-alive connections
+_SESSION = create_session()
+
+# Company overviews change at most daily
+_CACHE_NAMESPACE = "alpha_vantage_overview"
+_CACHE_TTL = 24 * 60 * 60
+
+# Parallel requests issued by the batch tool, kept low for the free-tier quota
+_MAX_CONCURRENT_REQUESTS = 5
+
+# Request rate allowed by the API key; the free tier allows 5 calls per minute
+_REQUESTS_PER_MINUTE = int(os.getenv("ALPHA_VANTAGE_REQUESTS_PER_MINUTE", "5"))
+
+# Attempts per overview when Alpha Vantage answers with a throttling note
+_RATE_LIMIT_ATTEMPTS = 3
+
+# OVERVIEW fields passed on to the agents; the endpoint returns about fifty,
+# most of which only add prompt tokens. Override with a comma-separated list in
+# ALPHA_VANTAGE_OVERVIEW_FIELDS.
+_DEFAULT_OVERVIEW_FIELDS = (
+    "Symbol,Name,Exchange,Currency,Country,Sector,Industry,MarketCapitalization,"
+    "EBITDA,PERatio,PEGRatio,BookValue,DividendPerShare,DividendYield,EPS,"
+    "RevenueTTM,ProfitMargin,OperatingMarginTTM,ReturnOnEquityTTM,"
+    "QuarterlyEarningsGrowthYOY,QuarterlyRevenueGrowthYOY,AnalystTargetPrice,"
+    "TrailingPE,ForwardPE,PriceToBookRatio,EVToEBITDA,Beta,52WeekHigh,52WeekLow,"
+    "50DayMovingAverage,200DayMovingAverage"
+)
+_OVERVIEW_FIELDS = frozenset(
+    field.strip()
+    for field in os.getenv(
+        "ALPHA_VANTAGE_OVERVIEW_FIELDS", _DEFAULT_OVERVIEW_FIELDS
+    ).split(",")
+    if field.strip()
+)
+
+# Placeholders Alpha Vantage uses for missing values
+_EMPTY_VALUES = frozenset({"None", "-", ""})
+
+
+class _TokenBucket:
+    """
+    Thread-safe token bucket spacing requests to a per-minute rate.
+
+    The bucket starts full, so a burst of up to `rate_per_minute` requests goes
+    out at once; later requests wait for tokens to refill.
+    """
+
+    def __init__(self, rate_per_minute: int) -> None:
+        self._capacity = float(max(rate_per_minute, 1))
+        self._refill_per_second = self._capacity / 60
+        self._tokens = self._capacity
+        self._updated = time.monotonic()
+        self._lock = threading.Lock()
+
+    def _refill(self) -> None:
+        now = time.monotonic()
+        self._tokens = min(
+            self._capacity,
+            self._tokens + (now - self._updated) * self._refill_per_second,
+        )
+        self._updated = now
+
+    def acquire(self) -> None:
+        """Block until a request may be sent."""
+        while True:
+            with self._lock:
+                self._refill()
+                # Tolerate float rounding left over from the refill arithmetic
+                if self._tokens >= 1 - 1e-9:
+                    self._tokens = max(self._tokens - 1, 0.0)
+                    return
+                wait = (1 - self._tokens) / self._refill_per_second
+            time.sleep(wait)
+
+    def drain(self) -> None:
+        """Empty the bucket after the server reported throttling."""
+        with self._lock:
+            self._refill()
+            self._tokens = 0.0
+
+
+_RATE_LIMITER = _TokenBucket(_REQUESTS_PER_MINUTE)
+
+# Requests currently in flight, keyed by ticker, so that agents asking for the
+# same company at the same time share a single HTTP call
+_INFLIGHT: dict[str, Future] = {}
+_INFLIGHT_LOCK = threading.Lock()
+
+
+def _request_overview(ticker: str) -> str:
+    """
+    Query the OVERVIEW endpoint and cache successful responses.
+
+    Args:
+        ticker: The stock ticker symbol
+
+    Returns:
+        The overview as a JSON string, or an error message.
+    """
+    url = _OVERVIEW_URL_TEMPLATE.format(ticker)
+
+    for attempt in range(_RATE_LIMIT_ATTEMPTS):
+        _RATE_LIMITER.acquire()
+        try:
+            response = _SESSION.get(url, timeout=DEFAULT_TIMEOUT)
+            response.raise_for_status()  # Raise an exception for bad status codes
+            data = orjson.loads(response.content)
+        except requests.exceptions.RequestException as e:
+            return f"Error fetching data from Alpha Vantage: {e}"
+        except orjson.JSONDecodeError:
+            return "Error: Failed to parse JSON response from Alpha Vantage."
+
+        # Throttling comes back as HTTP 200 with a "Note" or "Information"
+        # message; never cache it, wait for the quota window and retry
+        notice = data.get("Note") or data.get("Information")
+        if not notice:
+            break
+        if attempt == _RATE_LIMIT_ATTEMPTS - 1:
+            return f"Error: Alpha Vantage rate limit reached: {notice}"
+
+        delay = min(60, 15 * 2**attempt) + random.random()
+        logger.warning(
+            "Alpha Vantage throttled %s, retrying in %.0fs: %s", ticker, delay, notice
+        )
+        _RATE_LIMITER.drain()
+        time.sleep(delay)
+
+    if not data:
+        return f"No data found for ticker {ticker}. It might be an invalid symbol."
+
+    # Keep the useful fields; compact JSON since indentation only adds tokens
+    overview = {
+        key: value
+        for key, value in data.items()
+        if key in _OVERVIEW_FIELDS and value not in _EMPTY_VALUES
+    }
+    result = orjson.dumps(overview).decode()
+
+    try:
+        set_cached(_CACHE_NAMESPACE, ticker.upper(), result)
+    except OSError as e:
+        logger.warning("Failed to cache Alpha Vantage overview for %s: %s", ticker, e)
+    return result
+
+
+def _fetch_overview(ticker: str) -> str:
+    """
+    Return the overview for a ticker from the cache or the API.
+
+    Concurrent calls for the same ticker wait for the request already in
+    flight instead of issuing their own.
+
+    Args:
+        ticker: The stock ticker symbol
+
+    Returns:
+        The overview as a JSON string, or an error message.
+    """
+    key = ticker.upper()
+    cached = get_cached(_CACHE_NAMESPACE, key, _CACHE_TTL)
+    if cached is not None:
+        return cached
+
+    with _INFLIGHT_LOCK:
+        future = _INFLIGHT.get(key)
+        is_owner = future is None
+        if is_owner:
+            future = Future()
+            _INFLIGHT[key] = future
+
+    if not is_owner:
+        return future.result()
+
+    try:
+        result = _request_overview(ticker)
+        future.set_result(result)
+        return result
+    except BaseException as e:
+        future.set_exception(e)
+        raise
+    finally:
+        with _INFLIGHT_LOCK:
+            _INFLIGHT.pop(key, None)
 
 
 class CompanyOverviewInput(BaseModel):
     """Input schema for the AlphaVantageCompanyOverviewTool."""
 
-    ticker: str = Field(..., description="The stock ticker symbol to get information for.")
+    ticker: str = Field(
+        ..., description="The stock ticker symbol to get information for."
+    )
+
+
+class BatchCompanyOverviewInput(BaseModel):
+    """Input schema for the AlphaVantageBatchCompanyOverviewTool."""
+
+    tickers: list[str] = Field(
+        ..., description="The stock ticker symbols to get information for."
+    )
 
 
 class AlphaVantageCompanyOverviewTool(BaseTool):
@@ -36,34 +250,50 @@ class AlphaVantageCompanyOverviewTool(BaseTool):
     name: str = "Alpha Vantage Company Overview"
     description: str = (
         "Fetches fundamental data and a company overview for a specific stock ticker "
-        "from Alpha Vantage. Use this to get detailed financial metrics like Market Cap, "
-        "P/E Ratio, EPS, and more."
+        "from Alpha Vantage. Use this to get detailed financial metrics like "
+        "Market Cap, P/E Ratio, EPS, and more."
     )
     args_schema: Type[BaseModel] = CompanyOverviewInput
 
     def _run(self, ticker: str) -> str:
         """Execute the tool to fetch company overview data."""
-        api_key = os.getenv("ALPHA_VANTAGE_API_KEY")
-        if not api_key:
-            return "Error: ALPHA_VANTAGE_API_KEY environment variable not set."
+        if not _API_KEY:
+            return _MISSING_KEY_ERROR
 
-        url = (
-            f"https://www.alphavantage.co/query?function=OVERVIEW&symbol={ticker}"
-            f"&apikey={api_key}"
-        )
+        return _fetch_overview(ticker)
 
-        try:
-            response = requests.get(url, timeout=10)
-            response.raise_for_status()  # Raise an exception for bad status codes
-            data = response.json()
 
-            if not data or "Note" in data:
-                return f"No data found for ticker {ticker}. It might be an invalid symbol."
+class AlphaVantageBatchCompanyOverviewTool(BaseTool):
+    """
+    A tool to fetch company overviews for several tickers in one call.
 
-            # Filter out metadata and return a clean JSON string of the overview
-            return json.dumps(data, indent=2)
+    Tickers are fetched concurrently over the shared session, reusing the
+    cache and request coalescing of the single-ticker tool. It requires an
+    ALPHA_VANTAGE_API_KEY to be set in the environment variables.
+    """
 
-        except requests.exceptions.RequestException as e:
-            return f"Error fetching data from Alpha Vantage: {e}"
-        except json.JSONDecodeError:
-            return "Error: Failed to parse JSON response from Alpha Vantage."
+    name: str = "Alpha Vantage Batch Company Overview"
+    description: str = (
+        "Fetches fundamental data and company overviews for a list of stock tickers "
+        "from Alpha Vantage in a single call. Prefer this over the single-ticker "
+        "tool when comparing several companies."
+    )
+    args_schema: Type[BaseModel] = BatchCompanyOverviewInput
+
+    def _run(self, tickers: list[str]) -> str:
+        """Execute the tool to fetch company overview data for all tickers."""
+        if not _API_KEY:
+            return _MISSING_KEY_ERROR
+
+        # Deduplicate while keeping the caller's order
+        unique_tickers = list(dict.fromkeys(ticker.upper() for ticker in tickers))
+        if not unique_tickers:
+            return "Error: No tickers provided."
+
+        with ThreadPoolExecutor(max_workers=_MAX_CONCURRENT_REQUESTS) as executor:
+            results = executor.map(_fetch_overview, unique_tickers)
+
+        return "\n\n".join(
+            f"## {ticker}\n{result}"
+            for ticker, result in zip(unique_tickers, results)
+        )
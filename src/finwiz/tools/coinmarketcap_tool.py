@@ -5,18 +5,89 @@ This module provides tools for retrieving cryptocurrency data from the CoinMarke
 including pricing, market cap, and other relevant metrics for cryptocurrency analysis.
 """
 
+import functools
+import hashlib
 import os
 
+import orjson
 import requests
 from crewai.tools import BaseTool
+from dotenv import load_dotenv
 from pydantic import BaseModel, Field
 
 from finwiz.tools.logger import get_logger
+from finwiz.utils.cache_utils import get_cached, set_cached
+from finwiz.utils.http_utils import DEFAULT_TIMEOUT, create_session
 
 logger = get_logger(__name__)
 
+# Only read .env when the entry point has not already loaded the key
+if not os.getenv("X-CMC_PRO_API_KEY"):
+    load_dotenv()
+
+# Resolved once at import rather than on every call
+_API_KEY = os.getenv("X-CMC_PRO_API_KEY", "")
+_MISSING_KEY_ERROR = "Error: X-CMC_PRO_API_KEY environment variable not set."
+
 # Base URL for CoinMarketCap API
 CMC_BASE_URL = "https://pro-api.coinmarketcap.com/v1"
+_URL_MAP = f"{CMC_BASE_URL}/cryptocurrency/map"
+_URL_QUOTES_LATEST = f"{CMC_BASE_URL}/cryptocurrency/quotes/latest"
+_URL_LISTINGS_LATEST = f"{CMC_BASE_URL}/cryptocurrency/listings/latest"
+_URL_HISTORICAL = f"{CMC_BASE_URL}/cryptocurrency/quotes/historical"
+_URL_CONTENT_LATEST = f"{CMC_BASE_URL}/content/latest"
+
+# Shared session: keeps connections to the API host alive between tool calls
+# and sends the authentication headers with every request. Rate limiting is
+# common on the free plan, so 429s get more retries with jittered backoff. The
+# pool is sized for agents running tools in parallel threads.
+_SESSION = create_session(pool_maxsize=50, total_retries=5, full_jitter=True)
+_SESSION.headers.update(
+    {
+        "X-CMC_PRO_API_KEY": _API_KEY,
+        "Accept": "application/json",
+    }
+)
+
+# Response cache lifetimes in seconds, by how fast each endpoint's data moves
+_CACHE_NAMESPACE = "coinmarketcap"
+_QUOTES_TTL = 60
+_LISTINGS_TTL = 120
+_MAP_TTL = 24 * 60 * 60
+_HISTORICAL_TTL = 60 * 60
+_NEWS_TTL = 5 * 60
+
+# Map the list tool's sort parameter to the API sort parameter
+_SORT_MAP = {
+    "market_cap": "market_cap",
+    "volume_24h": "volume_24h",
+    "price": "price",
+    "percent_change_24h": "percent_change_24h",
+}
+
+# Map the historical tool's time period to the API interval
+_TIME_INTERVAL_MAP = {
+    "24h": "hourly",
+    "7d": "daily",
+    "30d": "daily",
+    "3m": "daily",
+    "1y": "weekly",
+    "ytd": "daily",
+}
+
+# Markdown table headers
+_LIST_TABLE_HEADER = (
+    "| Rank | Name | Symbol | Price (USD) | 24h Change | Market Cap | 24h Volume |\n"
+    "|------|------|--------|------------|------------|------------|------------|\n"
+)
+_HIST_HOURLY_HEADER = (
+    "| Date & Time | Price (USD) | Volume | Market Cap |\n"
+    "|-------------|-------------|--------|------------|\n"
+)
+_HIST_DAILY_HEADER = (
+    "| Date | Price (USD) | 24h Change | Volume | Market Cap |\n"
+    "|------|-------------|------------|--------|------------|\n"
+)
 
 
 class CoinMarketCapException(Exception):
@@ -25,6 +96,191 @@ class CoinMarketCapException(Exception):
     pass
 
 
+def get_cmc_session() -> requests.Session:
+    """
+    Return the session shared by the CoinMarketCap tools.
+
+    Callers can mount their own adapters on it, e.g. to mock the API.
+
+    Returns:
+        The shared `requests.Session`.
+
+    """
+    return _SESSION
+
+
+def _cmc_get(url: str, params: dict, ttl: float) -> dict:
+    """
+    Query a CoinMarketCap endpoint, serving repeated queries from the cache.
+
+    Only successful responses are cached, keyed by endpoint and parameters.
+
+    Args:
+        url: The endpoint URL
+        params: Query parameters
+        ttl: How long a cached response stays valid, in seconds
+
+    Returns:
+        The decoded JSON response.
+
+    Raises:
+        CoinMarketCapException: If the API returns a non-200 status
+
+    """
+    digest = hashlib.md5(repr(sorted(params.items())).encode("utf-8")).hexdigest()
+    cache_key = f"{url[len(CMC_BASE_URL) + 1 :]}_{digest}"
+
+    cached = get_cached(_CACHE_NAMESPACE, cache_key, ttl)
+    if cached is not None:
+        return orjson.loads(cached)
+
+    response = _SESSION.get(url, params=params, timeout=DEFAULT_TIMEOUT)
+    if response.status_code != 200:
+        error_msg = f"CoinMarketCap API error: {response.status_code} - {response.text}"
+        logger.error(error_msg)
+        raise CoinMarketCapException(error_msg)
+
+    data = orjson.loads(response.content)
+    try:
+        set_cached(_CACHE_NAMESPACE, cache_key, response.content.decode("utf-8"))
+    except OSError as e:
+        logger.warning("Failed to cache CoinMarketCap response: %s", e)
+    return data
+
+
+@functools.lru_cache(maxsize=256)
+def _get_crypto_id(symbol: str) -> int | None:
+    """
+    Resolve a cryptocurrency symbol to its CoinMarketCap ID.
+
+    The mapping is stable, so lookups are memoized for the process lifetime.
+
+    Args:
+        symbol: The upper-case cryptocurrency symbol
+
+    Returns:
+        The CoinMarketCap ID, or None if the symbol is unknown.
+
+    Raises:
+        CoinMarketCapException: If the API returns a non-200 status
+
+    """
+    id_data = _cmc_get(_URL_MAP, {"symbol": symbol}, _MAP_TTL)
+    if "data" not in id_data or not id_data["data"]:
+        return None
+    return id_data["data"][0]["id"]
+
+
+def _format_number(value: float | None, template: str) -> str:
+    """
+    Format a numeric field, which CoinMarketCap reports as null when unknown.
+
+    Args:
+        value: The field value
+        template: A `str.format` template applied to a known value
+
+    Returns:
+        The formatted value, or "N/A" for a null field
+
+    """
+    return "N/A" if value is None else template.format(value)
+
+
+def _format_coin_info(crypto_data: dict) -> str:
+    """
+    Format a quotes/latest entry as a Markdown block.
+
+    Args:
+        crypto_data: The entry for one cryptocurrency
+
+    Returns:
+        The formatted information
+
+    """
+    quote = crypto_data["quote"]["USD"]
+
+    symbol = crypto_data.get("symbol")
+    price = _format_number(quote.get("price"), "${:.4f} USD")
+    market_cap = _format_number(quote.get("market_cap"), "${:,.0f} USD")
+    volume_24h = _format_number(quote.get("volume_24h"), "${:,.0f} USD")
+    change_24h = _format_number(quote.get("percent_change_24h"), "{:.2f}%")
+    change_7d = _format_number(quote.get("percent_change_7d"), "{:.2f}%")
+    supply = _format_number(
+        crypto_data.get("circulating_supply"), "{:,.0f} " + str(symbol)
+    )
+
+    info = f"## {crypto_data.get('name')} ({symbol})\n\n"
+    info += f"**Current Price:** {price}\n"
+    info += f"**Market Cap:** {market_cap}\n"
+    info += f"**24h Volume:** {volume_24h}\n"
+    info += f"**24h Change:** {change_24h}\n"
+    info += f"**7d Change:** {change_7d}\n"
+    info += f"**Circulating Supply:** {supply}\n"
+
+    if crypto_data.get("max_supply"):
+        info += f"**Max Supply:** {crypto_data['max_supply']:,.0f} {symbol}\n"
+
+    info += f"**Market Cap Rank:** #{crypto_data.get('cmc_rank', 'N/A')}\n"
+    info += f"**Last Updated:** {quote.get('last_updated', 'N/A')}\n\n"
+
+    # Add additional details if available
+    if "platform" in crypto_data and crypto_data["platform"]:
+        info += f"**Token Platform:** {crypto_data['platform'].get('name', 'N/A')}\n"
+
+    if "tags" in crypto_data and crypto_data["tags"]:
+        info += f"**Categories:** {', '.join(crypto_data['tags'][:5])}\n"
+
+    return info
+
+
+def _fetch_coin_info(symbols: list[str]) -> str:
+    """
+    Retrieve and format quotes for several cryptocurrencies in one request.
+
+    Args:
+        symbols: The cryptocurrency symbols/tickers (e.g., BTC, ETH)
+
+    Returns:
+        The formatted information for each symbol, or an error message
+
+    """
+    # Deduplicate while keeping the caller's order
+    unique_symbols = list(dict.fromkeys(symbol.upper() for symbol in symbols))
+    if not unique_symbols:
+        return "Error: No cryptocurrency symbols provided."
+    joined = ",".join(unique_symbols)
+
+    try:
+        # Without skip_invalid, one unknown symbol fails the whole request
+        params = {"symbol": joined, "convert": "USD", "skip_invalid": "true"}
+
+        try:
+            data = _cmc_get(_URL_QUOTES_LATEST, params, _QUOTES_TTL)
+        except CoinMarketCapException as e:
+            return f"Error retrieving cryptocurrency data: {e}"
+
+        blocks = []
+        for symbol in unique_symbols:
+            if symbol not in data.get("data", {}):
+                logger.warning("No data found for symbol: %s", symbol)
+                blocks.append(f"No data found for cryptocurrency symbol: {symbol}\n")
+                continue
+            # A malformed entry only loses its own block, not the whole batch
+            try:
+                blocks.append(_format_coin_info(data["data"][symbol]))
+            except (KeyError, TypeError, ValueError) as e:
+                logger.warning("Could not format data for %s: %s", symbol, e)
+                blocks.append(f"Incomplete data for cryptocurrency symbol: {symbol}\n")
+
+        logger.info("Successfully retrieved information for %s", joined)
+        return "\n".join(blocks)
+
+    except Exception as e:
+        error_msg = f"Error retrieving cryptocurrency data for {joined}: {str(e)}"
+        logger.error(error_msg)
+        return error_msg
+
+
 class CoinInfoInput(BaseModel):
     """Input schema for CoinMarketCapInfoTool."""
 
@@ -33,6 +289,14 @@ class CoinInfoInput(BaseModel):
     )
 
 
+class BatchCoinInfoInput(BaseModel):
+    """Input schema for CoinMarketCapBatchInfoTool."""
+
+    symbols: list[str] = Field(
+        ..., description="Cryptocurrency symbols/tickers (e.g., BTC, ETH, SOL)"
+    )
+
+
 class CryptocurrencyListInput(BaseModel):
     """Input schema for CoinMarketCapListTool."""
 
@@ -98,67 +362,46 @@ class CoinMarketCapInfoTool(BaseTool):
             CoinMarketCapException: If the API request fails
 
         """
-        logger.info(f"Retrieving information for cryptocurrency: {symbol}")
-
-        try:
-            headers = {
-                "X-CMC_PRO_API_KEY": os.environ.get("X-CMC_PRO_API_KEY", ""),
-                "Accept": "application/json",
-            }
-
-            params = {"symbol": symbol.upper(), "convert": "USD"}
-
-            response = requests.get(
-                f"{CMC_BASE_URL}/cryptocurrency/quotes/latest",
-                headers=headers,
-                params=params,
-            )
-
-            if response.status_code != 200:
-                error_msg = (
-                    f"CoinMarketCap API error: {response.status_code} - {response.text}"
-                )
-                logger.error(error_msg)
-                return f"Error retrieving cryptocurrency data: {error_msg}"
+        if not _API_KEY:
+            return _MISSING_KEY_ERROR
 
-            data = response.json()
+        logger.info("Retrieving information for cryptocurrency: %s", symbol)
+        return _fetch_coin_info([symbol])
 
-            if "data" not in data or symbol.upper() not in data["data"]:
-                logger.warning(f"No data found for symbol: {symbol}")
-                return f"No data found for cryptocurrency symbol: {symbol}"
 
-            crypto_data = data["data"][symbol.upper()]
-            quote = crypto_data["quote"]["USD"]
+class CoinMarketCapBatchInfoTool(BaseTool):
+    """
+    Tool for retrieving detailed information about several cryptocurrencies.
 
-            # Format the information
-            info = f"## {crypto_data.get('name')} ({crypto_data.get('symbol')})\n\n"
-            info += f"**Current Price:** ${quote.get('price', 0):.4f} USD\n"
-            info += f"**Market Cap:** ${quote.get('market_cap', 0):,.0f} USD\n"
-            info += f"**24h Volume:** ${quote.get('volume_24h', 0):,.0f} USD\n"
-            info += f"**24h Change:** {quote.get('percent_change_24h', 0):.2f}%\n"
-            info += f"**7d Change:** {quote.get('percent_change_7d', 0):.2f}%\n"
-            info += f"**Circulating Supply:** {crypto_data.get('circulating_supply', 0):,.0f} {crypto_data.get('symbol')}\n"
+    All symbols are resolved with a single request to the quotes endpoint,
+    which accepts a comma-separated symbol list.
+    """
 
-            if crypto_data.get("max_supply"):
-                info += f"**Max Supply:** {crypto_data.get('max_supply', 0):,.0f} {crypto_data.get('symbol')}\n"
+    name: str = "CoinMarketCap Batch Cryptocurrency Info"
+    description: str = (
+        "Get detailed information about several cryptocurrencies in one call, "
+        "including price, market cap, volume, circulating supply, and other key "
+        "metrics. Provide a list of symbols (e.g., [BTC, ETH, SOL]). Prefer this "
+        "over the single-symbol tool when comparing cryptocurrencies."
+    )
+    args_schema: type[BaseModel] = BatchCoinInfoInput
 
-            info += f"**Market Cap Rank:** #{crypto_data.get('cmc_rank', 'N/A')}\n"
-            info += f"**Last Updated:** {quote.get('last_updated', 'N/A')}\n\n"
+    def _run(self, symbols: list[str]) -> str:
+        """
+        Retrieve detailed information about several cryptocurrencies.
 
-            # Add additional details if available
-            if "platform" in crypto_data and crypto_data["platform"]:
-                info += f"**Token Platform:** {crypto_data['platform'].get('name', 'N/A')}\n"
+        Args:
+            symbols: The cryptocurrency symbols/tickers (e.g., BTC, ETH)
 
-            if "tags" in crypto_data and crypto_data["tags"]:
-                info += f"**Categories:** {', '.join(crypto_data['tags'][:5])}\n"
+        Returns:
+            A string containing detailed information about each cryptocurrency
 
-            logger.info(f"Successfully retrieved information for {symbol}")
-            return info
+        """
+        if not _API_KEY:
+            return _MISSING_KEY_ERROR
 
-        except Exception as e:
-            error_msg = f"Error retrieving cryptocurrency data for {symbol}: {str(e)}"
-            logger.error(error_msg)
-            return error_msg
+        logger.info("Retrieving information for cryptocurrencies: %s", symbols)
+        return _fetch_coin_info(symbols)
 
 
 class CoinMarketCapListTool(BaseTool):
@@ -191,69 +434,57 @@ class CoinMarketCapListTool(BaseTool):
             CoinMarketCapException: If the API request fails
 
         """
-        logger.info(f"Retrieving top {limit} cryptocurrencies sorted by {sort}")
+        if not _API_KEY:
+            return _MISSING_KEY_ERROR
+
+        logger.info("Retrieving top %s cryptocurrencies sorted by %s", limit, sort)
 
         # Validate and cap limit
         if limit > 100:
             limit = 100
             logger.warning("Limit capped at 100 cryptocurrencies")
 
-        # Map sort parameter to API sort parameter
-        sort_map = {
-            "market_cap": "market_cap",
-            "volume_24h": "volume_24h",
-            "price": "price",
-            "percent_change_24h": "percent_change_24h",
-        }
-
-        sort_by = sort_map.get(sort, "market_cap")
+        sort_by = _SORT_MAP.get(sort, "market_cap")
 
         try:
-            headers = {
-                "X-CMC_PRO_API_KEY": os.environ.get("X-CMC_PRO_API_KEY", ""),
-                "Accept": "application/json",
-            }
-
             params = {"limit": limit, "sort": sort_by, "convert": "USD"}
 
-            response = requests.get(
-                f"{CMC_BASE_URL}/cryptocurrency/listings/latest",
-                headers=headers,
-                params=params,
-            )
-
-            if response.status_code != 200:
-                error_msg = (
-                    f"CoinMarketCap API error: {response.status_code} - {response.text}"
+            try:
+                data = _cmc_get(
+                    _URL_LISTINGS_LATEST,
+                    params,
+                    _LISTINGS_TTL,
                 )
-                logger.error(error_msg)
-                return f"Error retrieving cryptocurrency list: {error_msg}"
-
-            data = response.json()
+            except CoinMarketCapException as e:
+                return f"Error retrieving cryptocurrency list: {e}"
 
             if "data" not in data:
                 logger.warning("No cryptocurrency data found")
                 return "No cryptocurrency data found"
 
             # Format the information
-            result = f"## Top {limit} Cryptocurrencies by {sort.replace('_', ' ').title()}\n\n"
-            result += "| Rank | Name | Symbol | Price (USD) | 24h Change | Market Cap | 24h Volume |\n"
-            result += "|------|------|--------|------------|------------|------------|------------|\n"
+            sort_label = sort.replace("_", " ").title()
+            parts = [
+                f"## Top {limit} Cryptocurrencies by {sort_label}\n\n",
+                _LIST_TABLE_HEADER,
+            ]
 
             for crypto in data["data"]:
                 quote = crypto["quote"]["USD"]
-                result += f"| {crypto.get('cmc_rank', 'N/A')} "
-                result += f"| {crypto.get('name', 'Unknown')} "
-                result += f"| {crypto.get('symbol', 'N/A')} "
-                result += f"| ${quote.get('price', 0):.4f} "
-                result += f"| {quote.get('percent_change_24h', 0):.2f}% "
-                result += f"| ${quote.get('market_cap', 0) / 1e9:.2f}B "
-                result += f"| ${quote.get('volume_24h', 0) / 1e6:.2f}M |\n"
+                parts.append(
+                    f"| {crypto.get('cmc_rank', 'N/A')} "
+                    f"| {crypto.get('name', 'Unknown')} "
+                    f"| {crypto.get('symbol', 'N/A')} "
+                    f"| ${quote.get('price', 0):.4f} "
+                    f"| {quote.get('percent_change_24h', 0):.2f}% "
+                    f"| ${quote.get('market_cap', 0) / 1e9:.2f}B "
+                    f"| ${quote.get('volume_24h', 0) / 1e6:.2f}M |\n"
+                )
 
             logger.info(
-                f"Successfully retrieved list of {len(data['data'])} cryptocurrencies"
+                "Successfully retrieved list of %s cryptocurrencies", len(data["data"])
             )
-            return result
+            return "".join(parts)
 
         except Exception as e:
             error_msg = f"Error retrieving cryptocurrency list: {str(e)}"
@@ -291,46 +522,24 @@ class CoinMarketCapHistoricalTool(BaseTool):
             CoinMarketCapException: If the API request fails
 
         """
-        logger.info(f"Retrieving {time_period} historical data for {symbol}")
+        if not _API_KEY:
+            return _MISSING_KEY_ERROR
 
-        # Map time period to interval
-        time_map = {
-            "24h": "hourly",
-            "7d": "daily",
-            "30d": "daily",
-            "3m": "daily",
-            "1y": "weekly",
-            "ytd": "daily",
-        }
+        logger.info("Retrieving %s historical data for %s", time_period, symbol)
 
-        interval = time_map.get(time_period, "daily")
+        interval = _TIME_INTERVAL_MAP.get(time_period, "daily")
 
         try:
-            headers = {
-                "X-CMC_PRO_API_KEY": os.environ.get("X-CMC_PRO_API_KEY", ""),
-                "Accept": "application/json",
-            }
-
             # For historical data, we first need to get the crypto ID
-            id_params = {"symbol": symbol.upper()}
-
-            id_response = requests.get(
-                f"{CMC_BASE_URL}/cryptocurrency/map", headers=headers, params=id_params
-            )
-
-            if id_response.status_code != 200:
-                error_msg = f"CoinMarketCap API error: {id_response.status_code} - {id_response.text}"
-                logger.error(error_msg)
-                return f"Error retrieving cryptocurrency ID: {error_msg}"
+            try:
+                crypto_id = _get_crypto_id(symbol.upper())
+            except CoinMarketCapException as e:
+                return f"Error retrieving cryptocurrency ID: {e}"
 
-            id_data = id_response.json()
-
-            if "data" not in id_data or not id_data["data"]:
-                logger.warning(f"No ID found for symbol: {symbol}")
+            if crypto_id is None:
+                logger.warning("No ID found for symbol: %s", symbol)
                 return f"No ID found for cryptocurrency symbol: {symbol}"
 
-            crypto_id = id_data["data"][0]["id"]
-
             # Now get the historical data
             history_params = {
                 "id": crypto_id,
@@ -339,62 +548,62 @@ class CoinMarketCapHistoricalTool(BaseTool):
                 "time_period": time_period,
             }
 
-            history_response = requests.get(
-                f"{CMC_BASE_URL}/cryptocurrency/quotes/historical",
-                headers=headers,
-                params=history_params,
-            )
-
-            if history_response.status_code != 200:
-                error_msg = f"CoinMarketCap API error: {history_response.status_code} - {history_response.text}"
-                logger.error(error_msg)
-                return f"Error retrieving historical data: {error_msg}"
-
-            history_data = history_response.json()
+            try:
+                history_data = _cmc_get(
+                    _URL_HISTORICAL,
+                    history_params,
+                    _HISTORICAL_TTL,
+                )
+            except CoinMarketCapException as e:
+                return f"Error retrieving historical data: {e}"
 
             if "data" not in history_data or "quotes" not in history_data["data"]:
-                logger.warning(f"No historical data found for {symbol}")
+                logger.warning("No historical data found for %s", symbol)
                 return f"No historical data found for {symbol} over {time_period}"
 
             quotes = history_data["data"]["quotes"]
 
             # Format the information
-            result = f"## Historical Data for {symbol} over {time_period}\n\n"
+            parts = [f"## Historical Data for {symbol} over {time_period}\n\n"]
 
             # Determine the format based on the interval
             if interval == "hourly":
-                result += "| Date & Time | Price (USD) | Volume | Market Cap |\n"
-                result += "|-------------|-------------|--------|------------|\n"
+                parts.append(_HIST_HOURLY_HEADER)
 
                 for quote in quotes:
                     timestamp = quote.get("timestamp", "N/A")
-                    price = quote["quote"]["USD"].get("price", 0)
-                    volume = quote["quote"]["USD"].get("volume_24h", 0)
-                    market_cap = quote["quote"]["USD"].get("market_cap", 0)
-
-                    result += f"| {timestamp} "
-                    result += f"| ${price:.4f} "
-                    result += f"| ${volume / 1e6:.2f}M "
-                    result += f"| ${market_cap / 1e9:.2f}B |\n"
+                    usd = quote["quote"]["USD"]
+                    price = usd.get("price", 0)
+                    volume = usd.get("volume_24h", 0)
+                    market_cap = usd.get("market_cap", 0)
+
+                    parts.append(
+                        f"| {timestamp} "
+                        f"| ${price:.4f} "
+                        f"| ${volume / 1e6:.2f}M "
+                        f"| ${market_cap / 1e9:.2f}B |\n"
+                    )
             else:
-                result += "| Date | Price (USD) | 24h Change | Volume | Market Cap |\n"
-                result += "|------|-------------|------------|--------|------------|\n"
+                parts.append(_HIST_DAILY_HEADER)
 
                 for quote in quotes:
                     timestamp = quote.get("timestamp", "N/A").split("T")[0]
-                    price = quote["quote"]["USD"].get("price", 0)
-                    change = quote["quote"]["USD"].get("percent_change_24h", 0)
-                    volume = quote["quote"]["USD"].get("volume_24h", 0)
-                    market_cap = quote["quote"]["USD"].get("market_cap", 0)
-
-                    result += f"| {timestamp} "
-                    result += f"| ${price:.4f} "
-                    result += f"| {change:.2f}% "
-                    result += f"| ${volume / 1e6:.2f}M "
-                    result += f"| ${market_cap / 1e9:.2f}B |\n"
-
-            logger.info(f"Successfully retrieved historical data for {symbol}")
-            return result
+                    usd = quote["quote"]["USD"]
+                    price = usd.get("price", 0)
+                    change = usd.get("percent_change_24h", 0)
+                    volume = usd.get("volume_24h", 0)
+                    market_cap = usd.get("market_cap", 0)
+
+                    parts.append(
+                        f"| {timestamp} "
+                        f"| ${price:.4f} "
+                        f"| {change:.2f}% "
+                        f"| ${volume / 1e6:.2f}M "
+                        f"| ${market_cap / 1e9:.2f}B |\n"
+                    )
+
+            logger.info("Successfully retrieved historical data for %s", symbol)
+            return "".join(parts)
 
         except Exception as e:
             error_msg = f"Error retrieving historical data for {symbol}: {str(e)}"
@@ -432,10 +641,13 @@ class CoinMarketCapNewsTool(BaseTool):
             CoinMarketCapException: If the API request fails
 
         """
+        if not _API_KEY:
+            return _MISSING_KEY_ERROR
+
         if symbol:
-            logger.info(f"Retrieving top {limit} news articles for {symbol}")
+            logger.info("Retrieving top %s news articles for %s", limit, symbol)
         else:
-            logger.info(f"Retrieving top {limit} cryptocurrency news articles")
+            logger.info("Retrieving top %s cryptocurrency news articles", limit)
 
         # Validate and cap limit
         if limit > 100:
@@ -443,48 +655,25 @@ class CoinMarketCapNewsTool(BaseTool):
             logger.warning("Limit capped at 100 news articles")
 
         try:
-            headers = {
-                "X-CMC_PRO_API_KEY": os.environ.get("X-CMC_PRO_API_KEY", ""),
-                "Accept": "application/json",
-            }
-
             params = {"limit": limit}
 
             # If symbol is provided, get its ID first
             if symbol:
-                id_params = {"symbol": symbol.upper()}
-
-                id_response = requests.get(
-                    f"{CMC_BASE_URL}/cryptocurrency/map",
-                    headers=headers,
-                    params=id_params,
-                )
-
-                if id_response.status_code != 200:
-                    error_msg = f"CoinMarketCap API error: {id_response.status_code} - {id_response.text}"
-                    logger.error(error_msg)
-                    return f"Error retrieving cryptocurrency ID: {error_msg}"
+                try:
+                    crypto_id = _get_crypto_id(symbol.upper())
+                except CoinMarketCapException as e:
+                    return f"Error retrieving cryptocurrency ID: {e}"
 
-                id_data = id_response.json()
-
-                if "data" not in id_data or not id_data["data"]:
-                    logger.warning(f"No ID found for symbol: {symbol}")
+                if crypto_id is None:
+                    logger.warning("No ID found for symbol: %s", symbol)
                     return f"No ID found for cryptocurrency symbol: {symbol}"
 
-                params["cryptocurrencies"] = id_data["data"][0]["id"]
-
-            response = requests.get(
-                f"{CMC_BASE_URL}/content/latest", headers=headers, params=params
-            )
+                params["cryptocurrencies"] = crypto_id
 
-            if response.status_code != 200:
-                error_msg = (
-                    f"CoinMarketCap API error: {response.status_code} - {response.text}"
-                )
-                logger.error(error_msg)
-                return f"Error retrieving cryptocurrency news: {error_msg}"
-
-            data = response.json()
+            try:
+                data = _cmc_get(_URL_CONTENT_LATEST, params, _NEWS_TTL)
+            except CoinMarketCapException as e:
+                return f"Error retrieving cryptocurrency news: {e}"
 
             if "data" not in data:
                 logger.warning("No news articles found")
@@ -492,22 +681,22 @@ class CoinMarketCapNewsTool(BaseTool):
 
             # Format the information
             if symbol:
-                result = f"## Latest News for {symbol}\n\n"
+                parts = [f"## Latest News for {symbol}\n\n"]
             else:
-                result = "## Latest Cryptocurrency News\n\n"
+                parts = ["## Latest Cryptocurrency News\n\n"]
 
             for article in data["data"]:
-                result += f"### {article.get('title', 'No Title')}\n"
-                result += f"**Date:** {article.get('published_at', 'N/A')}\n"
-                result += f"**Source:** {article.get('source', 'Unknown')}\n\n"
-                result += (
+                parts.append(
+                    f"### {article.get('title', 'No Title')}\n"
+                    f"**Date:** {article.get('published_at', 'N/A')}\n"
+                    f"**Source:** {article.get('source', 'Unknown')}\n\n"
                     f"{article.get('description', 'No description available.')}\n\n"
+                    f"[Read more]({article.get('url', '#')})\n\n"
+                    "---\n\n"
                 )
-                result += f"[Read more]({article.get('url', '#')})\n\n"
-                result += "---\n\n"
 
-            logger.info(f"Successfully retrieved {len(data['data'])} news articles")
-            return result
+            logger.info("Successfully retrieved %s news articles", len(data["data"]))
+            return "".join(parts)
 
         except Exception as e:
             error_msg = f"Error retrieving cryptocurrency news: {str(e)}"
@@ -515,17 +704,21 @@ class CoinMarketCapNewsTool(BaseTool):
             return error_msg
 
 
-def get_coinmarketcap_tools() -> list[BaseTool]:
+@functools.lru_cache(maxsize=1)
+def get_coinmarketcap_tools() -> tuple[BaseTool, ...]:
     """
-    Get a list of all CoinMarketCap tools.
+    Get all CoinMarketCap tools.
+
+    The tools are stateless, so the same instances are returned on every call.
 
     Returns:
-        A list of CoinMarketCap tool instances
+        A tuple of CoinMarketCap tool instances
 
     """
-    return [
+    return (
         CoinMarketCapInfoTool(),
+        CoinMarketCapBatchInfoTool(),
         CoinMarketCapListTool(),
         CoinMarketCapHistoricalTool(),
         CoinMarketCapNewsTool(),
-    ]
+    )
@@ -11,7 +11,7 @@ from typing import Any
 from langchain_core.language_models.chat_models import BaseChatModel
 from langchain_core.language_models.llms import BaseLLM
 
-from finwiz.tools.llm_retry import get_llm_with_retries
+from finwiz.tools.llm_retry import RetryLLMWrapper, get_llm_with_retries
 from finwiz.tools.logger import get_logger
 
 # Get logger for this module
@@ -20,6 +20,42 @@ logger = get_logger(__name__)
 # Keep track of patched modules to avoid duplicate patching
 _PATCHED = False
 
+# Set once the retry mechanism (timeouts and patch) has been initialized
+_INITIALIZED = False
+
+# Retry wrappers already built, keyed by id() of the wrapped LLM. The LLM is
+# kept alongside its wrapper so that its id cannot be reused by another object.
+_WRAPPED_LLMS: dict[int, tuple[Any, RetryLLMWrapper]] = {}
+
+
+def _wrap_with_retries(llm: Any, max_retries: int, verbose: bool) -> Any:
+    """
+    Wrap a LangChain LLM with retry logic, reusing an existing wrapper.
+
+    Agents sharing an LLM get the same wrapper, and LLMs that are already
+    wrapped are returned unchanged.
+
+    Args:
+        llm: The LLM returned by CrewAI
+        max_retries: Maximum number of retry attempts for LLM calls
+        verbose: Whether to log detailed retry information
+
+    Returns:
+        The retry-wrapped LLM, or the LLM itself if it cannot be wrapped.
+
+    """
+    if isinstance(llm, RetryLLMWrapper) or not isinstance(llm, BaseLLM | BaseChatModel):
+        return llm
+
+    cached = _WRAPPED_LLMS.get(id(llm))
+    if cached is not None and cached[0] is llm:
+        return cached[1]
+
+    logger.info("Adding retry wrapper to LLM: %s", type(llm).__name__)
+    wrapped = get_llm_with_retries(llm, max_retries=max_retries, verbose=verbose)
+    _WRAPPED_LLMS[id(llm)] = (llm, wrapped)
+    return wrapped
+
 
 def patch_crewai_llm_initialization(max_retries: int = 5, verbose: bool = True) -> None:
     """
@@ -53,40 +89,22 @@ def patch_crewai_llm_initialization(max_retries: int = 5, verbose: bool = True)
             original_get_model = OpenAIAdapter.get_model
 
         logger.info(
-            f"Patching CrewAI LLM initialization with {max_retries} max retries"
+            "Patching CrewAI LLM initialization with %s max retries", max_retries
         )
 
         # Patch the Agent._get_llm method to wrap LLMs with retry capability
         def patched_get_llm(agent_self) -> Any:
             """Patched version of _get_llm that adds retry capabilities."""
-            # Get the original LLM
             llm = original_get_llm(agent_self)
-
-            # Check if it's a langchain LLM that we can wrap
-            if isinstance(llm, BaseLLM | BaseChatModel):
-                logger.info(f"Adding retry wrapper to LLM: {type(llm).__name__}")
-                return get_llm_with_retries(
-                    llm, max_retries=max_retries, verbose=verbose
-                )
-            return llm
+            return _wrap_with_retries(llm, max_retries, verbose)
 
         # Patch OpenAI adapter if applicable
         if original_get_model:
 
             def patched_get_model(adapter_self, *args: Any, **kwargs: Any) -> Any:
                 """Patched version of get_model that adds retry capabilities."""
-                # Get the original model
                 model = original_get_model(adapter_self, *args, **kwargs)
-
-                # Check if it's a langchain LLM that we can wrap
-                if isinstance(model, BaseLLM | BaseChatModel):
-                    logger.info(
-                        f"Adding retry wrapper to OpenAI model: {type(model).__name__}"
-                    )
-                    return get_llm_with_retries(
-                        model, max_retries=max_retries, verbose=verbose
-                    )
-                return model
+                return _wrap_with_retries(model, max_retries, verbose)
 
             # Apply the patch to OpenAI adapter
             OpenAIAdapter.get_model = patched_get_model
@@ -99,9 +117,9 @@ def patch_crewai_llm_initialization(max_retries: int = 5, verbose: bool = True)
         logger.info("Successfully patched CrewAI LLM initialization with retry logic")
 
     except ImportError as e:
-        logger.error(f"Failed to patch CrewAI - module not found: {str(e)}")
+        logger.error("Failed to patch CrewAI - module not found: %s", e)
     except Exception as e:
-        logger.error(f"Failed to patch CrewAI with retry logic: {str(e)}")
+        logger.error("Failed to patch CrewAI with retry logic: %s", e)
 
 
 def initialize_retry_mechanism(max_retries: int = 5, timeout: int = 180) -> None:
@@ -109,24 +127,30 @@ def initialize_retry_mechanism(max_retries: int = 5, timeout: int = 180) -> None
     Initialize the LLM retry mechanism for FinWiz.
 
     This function should be called early in the application startup
-    to ensure all LLM calls have retry capabilities.
+    to ensure all LLM calls have retry capabilities. Only the first call
+    in a process has an effect.
 
     Args:
         max_retries: Maximum number of retry attempts for LLM calls
         timeout: Timeout in seconds for LLM API calls (default: 180 seconds)
 
     """
+    global _INITIALIZED
+    if _INITIALIZED:
+        logger.debug("LLM retry mechanism already initialized")
+        return
+
     # Patch OpenAI client's default timeout settings
     try:
         import openai
 
         # Set longer default timeout for OpenAI client
         openai.timeout = timeout
-        logger.info(f"Set OpenAI client timeout to {timeout} seconds")
+        logger.info("Set OpenAI client timeout to %s seconds", timeout)
     except ImportError:
         logger.warning("OpenAI client not found, skipping timeout setting")
     except Exception as e:
-        logger.warning(f"Failed to set OpenAI timeout: {e}")
+        logger.warning("Failed to set OpenAI timeout: %s", e)
 
     # Patch HTTPX client timeout in CrewAI
     try:
@@ -137,12 +161,13 @@ def initialize_retry_mechanism(max_retries: int = 5, timeout: int = 180) -> None
 
         if hasattr(OpenAIChat, "client") and hasattr(OpenAIChat.client, "timeout"):
             OpenAIChat.client.timeout = httpx.Timeout(timeout)
-            logger.info(f"Set CrewAI OpenAIChat client timeout to {timeout} seconds")
+            logger.info("Set CrewAI OpenAIChat client timeout to %s seconds", timeout)
     except ImportError:
         logger.warning("HTTPX or CrewAI OpenAIChat not found, skipping timeout setting")
     except Exception as e:
-        logger.warning(f"Failed to set HTTPX timeout: {e}")
+        logger.warning("Failed to set HTTPX timeout: %s", e)
 
-    logger.info(f"Initializing LLM retry mechanism with {max_retries} max retries")
+    logger.info("Initializing LLM retry mechanism with %s max retries", max_retries)
     patch_crewai_llm_initialization(max_retries=max_retries, verbose=True)
+    _INITIALIZED = True
     logger.info("LLM retry mechanism initialized successfully")
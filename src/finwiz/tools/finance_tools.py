@@ -2,97 +2,105 @@
 Finance tool initialization module for FinWiz crews.
 
 This module provides convenient functions to initialize and register
-financial data tools for use in FinWiz crews.
+financial data tools for use in FinWiz crews. The tools are stateless, so
+each factory builds its tuple once and returns the same instances on later
+calls.
 """
 
+import functools
+
 from crewai.tools import BaseTool
 
 from finwiz.tools.yahoo_finance_company_info_tool import YahooFinanceCompanyInfoTool
 from finwiz.tools.yahoo_finance_etf_holdings_tool import YahooFinanceETFHoldingsTool
-from finwiz.tools.yahoo_finance_history_tool import YahooFinanceHistoryTool
+from finwiz.tools.yahoo_finance_history_tool import (
+    YahooFinanceBatchHistoryTool,
+    YahooFinanceHistoryTool,
+)
 from finwiz.tools.yahoo_finance_news_tool import YahooFinanceNewsTool
-from finwiz.tools.alpha_vantage_tool import AlphaVantageCompanyOverviewTool
+from finwiz.tools.alpha_vantage_tool import (
+    AlphaVantageBatchCompanyOverviewTool,
+    AlphaVantageCompanyOverviewTool,
+)
 from finwiz.tools.yahoo_finance_ticker_info_tool import YahooFinanceTickerInfoTool
-from finwiz.tools.kraken_api_tool import KrakenTickerInfoTool
+from finwiz.tools.kraken_api_tool import (
+    KrakenBatchTickerInfoTool,
+    KrakenTickerInfoTool,
+)
 
 
-def get_yahoo_finance_tools() -> list[BaseTool]:
+@functools.lru_cache(maxsize=1)
+def get_yahoo_finance_tools() -> tuple[BaseTool, ...]:
     """
     Initialize and return all Yahoo Finance tools.
 
     Returns:
-        list[BaseTool]: A list of initialized Yahoo Finance tools ready for crew usage.
+        tuple[BaseTool, ...]: The initialized Yahoo Finance tools, ready for crews.
 
     """
-    return [
+    return (
         YahooFinanceTickerInfoTool(),
         YahooFinanceHistoryTool(),
+        YahooFinanceBatchHistoryTool(),
         YahooFinanceCompanyInfoTool(),
         YahooFinanceETFHoldingsTool(),
         YahooFinanceNewsTool(),
-    ]
+    )
 
 
-def get_stock_research_tools() -> list[BaseTool]:
+@functools.lru_cache(maxsize=1)
+def get_stock_research_tools() -> tuple[BaseTool, ...]:
     """
     Get tools optimized for stock research.
 
     Returns:
-        list[BaseTool]: A list of tools focused on stock analysis.
+        tuple[BaseTool, ...]: A tuple of tools focused on stock analysis.
 
     """
-    return [
+    return (
         YahooFinanceTickerInfoTool(),
         YahooFinanceHistoryTool(),
+        YahooFinanceBatchHistoryTool(),
         YahooFinanceCompanyInfoTool(),
         YahooFinanceNewsTool(),
         AlphaVantageCompanyOverviewTool(),
-    ]
+        AlphaVantageBatchCompanyOverviewTool(),
+    )
 
 
-def get_crypto_research_tools() -> list[BaseTool]:
+@functools.lru_cache(maxsize=1)
+def get_crypto_research_tools() -> tuple[BaseTool, ...]:
     """
     Get tools optimized for crypto research.
 
     Returns:
-        list[BaseTool]: A list of tools focused on crypto analysis.
+        tuple[BaseTool, ...]: A tuple of tools focused on crypto analysis.
 
     """
-    return [
+    return (
         YahooFinanceHistoryTool(),
+        YahooFinanceBatchHistoryTool(),
         YahooFinanceNewsTool(),
         YahooFinanceTickerInfoTool(),
         KrakenTickerInfoTool(),
-    ]
+        KrakenBatchTickerInfoTool(),
+    )
 
 
-def get_etf_research_tools() -> list[BaseTool]:
+@functools.lru_cache(maxsize=1)
+def get_etf_research_tools() -> tuple[BaseTool, ...]:
     """
     Get tools optimized for ETF research.
 
     Returns:
-        list[BaseTool]: A list of tools focused on ETF analysis.
+        tuple[BaseTool, ...]: A tuple of tools focused on ETF analysis.
 
     """
-    return [
+    return (
         YahooFinanceTickerInfoTool(),
         YahooFinanceHistoryTool(),
+        YahooFinanceBatchHistoryTool(),
         YahooFinanceETFHoldingsTool(),
         YahooFinanceNewsTool(),
-    ]
-
-
-def get_crypto_research_tools() -> list[BaseTool]:
-    """
-    Get tools optimized for cryptocurrency research.
-
-    Returns:
-        list[BaseTool]: A list of tools focused on cryptocurrency analysis.
-
-    """
-    return [
-        YahooFinanceTickerInfoTool(),
-        YahooFinanceHistoryTool(),
-        YahooFinanceNewsTool(),
-    ]
+    )
 
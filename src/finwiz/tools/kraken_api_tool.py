@@ -5,13 +5,140 @@ This module provides tools for interacting with the Kraken cryptocurrency exchan
 It allows for fetching market data like ticker information, order books, and historical data.
 """
 
-import json
+import functools
+import time
 from typing import Type
 
+import orjson
 import requests
 from crewai.tools import BaseTool
 from pydantic import BaseModel, Field
 
+from finwiz.tools.logger import get_logger
+from finwiz.utils.http_utils import DEFAULT_TIMEOUT, create_session
+
+logger = get_logger(__name__)
+
+_KRAKEN_TICKER_URL = "https://api.kraken.com/0/public/Ticker"
+
+# Shared session so repeated ticker lookups reuse pooled keep-alive connections
+_SESSION = create_session(pool_maxsize=50, backoff_factor=0.3)
+
+# Ticker data is served from memory for up to this many seconds
+_TICKER_TTL = 30
+
+
+class KrakenAPIError(Exception):
+    """Exception raised when Kraken returns an error or no data for a pair."""
+
+
+@functools.lru_cache(maxsize=128)
+def _fetch_tickers(pairs: str, bucket: int) -> str:
+    """
+    Fetch ticker data for one or more pairs from Kraken in a single request.
+
+    Results are memoized per time bucket, so repeated calls for the same pairs
+    within one bucket skip the request. Errors are raised, not cached.
+
+    Args:
+        pairs: Comma-separated cryptocurrency pairs (e.g., 'XXBTZUSD,XETHZUSD')
+        bucket: The current time bucket, `int(time.time() // _TICKER_TTL)`
+
+    Returns:
+        The ticker data as a JSON string. For a single pair this is the pair's
+        ticker; for several it maps Kraken's pair names to their tickers.
+
+    Raises:
+        KrakenAPIError: If Kraken reports an error or returns no data
+    """
+    response = _SESSION.get(
+        _KRAKEN_TICKER_URL, params={"pair": pairs}, timeout=DEFAULT_TIMEOUT
+    )
+    response.raise_for_status()
+    data = orjson.loads(response.content)
+
+    if data.get("error"):
+        raise KrakenAPIError(f"Error from Kraken API: {data['error']}")
+
+    # The actual ticker data is nested under the pair name in the result
+    result = data.get("result", {})
+    if not result:
+        raise KrakenAPIError(
+            f"No data found for pair {pairs}. It may be an invalid pair."
+        )
+
+    if "," not in pairs:
+        result = next(iter(result.values()))
+    return orjson.dumps(result, option=orjson.OPT_INDENT_2).decode()
+
+
+# Failures of a ticker lookup that are reported to the agent as a message
+_FETCH_ERRORS = (
+    KrakenAPIError,
+    requests.exceptions.RequestException,
+    orjson.JSONDecodeError,
+)
+
+
+def _describe_error(error: Exception) -> str:
+    """
+    Turn a failed ticker lookup into the message returned by the tools.
+
+    Args:
+        error: One of the `_FETCH_ERRORS` exceptions
+
+    Returns:
+        The error message.
+    """
+    if isinstance(error, orjson.JSONDecodeError):
+        return "Error: Failed to parse JSON response from Kraken."
+    if isinstance(error, requests.exceptions.RequestException):
+        return f"Error fetching data from Kraken: {error}"
+    return str(error)
+
+
+def _get_tickers(pairs: str) -> str:
+    """
+    Return ticker data for comma-separated pairs, or an error message.
+
+    Args:
+        pairs: Comma-separated cryptocurrency pairs
+
+    Returns:
+        The ticker data as a JSON string, or an error message.
+    """
+    try:
+        return _fetch_tickers(pairs, int(time.time() // _TICKER_TTL))
+    except _FETCH_ERRORS as e:
+        return _describe_error(e)
+
+
+def _get_tickers_each(pairs: list[str]) -> str:
+    """
+    Fetch ticker data pair by pair, reporting each failed pair separately.
+
+    Args:
+        pairs: Cryptocurrency pairs to look up
+
+    Returns:
+        The tickers of the valid pairs as a JSON string keyed by the requested
+        pair names, followed by one error line per failed pair.
+    """
+    bucket = int(time.time() // _TICKER_TTL)
+    tickers = {}
+    errors = []
+    for pair in pairs:
+        try:
+            tickers[pair] = orjson.loads(_fetch_tickers(pair, bucket))
+        except _FETCH_ERRORS as e:
+            errors.append(f"{pair}: {_describe_error(e)}")
+
+    lines = []
+    if tickers:
+        lines.append(orjson.dumps(tickers, option=orjson.OPT_INDENT_2).decode())
+    lines.extend(errors)
+    return "\n".join(lines)
+
 
 class TickerInfoInput(BaseModel):
     """Input schema for the KrakenTickerInfoTool."""
@@ -19,6 +146,16 @@ class TickerInfoInput(BaseModel):
     pair: str = Field(..., description="The cryptocurrency pair to get ticker information for (e.g., 'XXBTZUSD').")
 
 
+class BatchTickerInfoInput(BaseModel):
+    """Input schema for the KrakenBatchTickerInfoTool."""
+
+    pairs: list[str] = Field(
+        ...,
+        description="The cryptocurrency pairs to get ticker information for "
+        "(e.g., ['XXBTZUSD', 'XETHZUSD']).",
+    )
+
+
 class KrakenTickerInfoTool(BaseTool):
     """
     A tool to fetch real-time ticker information from Kraken.
@@ -33,25 +170,46 @@ class KrakenTickerInfoTool(BaseTool):
 
     def _run(self, pair: str) -> str:
         """Execute the tool to fetch ticker data."""
-        url = f"https://api.kraken.com/0/public/Ticker?pair={pair}"
+        return _get_tickers(pair)
 
-        try:
-            response = requests.get(url, timeout=10)
-            response.raise_for_status()
-            data = response.json()
 
-            if data.get("error"):
-                return f"Error from Kraken API: {data['error']}"
+class KrakenBatchTickerInfoTool(BaseTool):
+    """
+    A tool to fetch real-time ticker information for several pairs at once.
 
-            # The actual ticker data is nested under the pair name in the result
-            result_pair = list(data.get("result", {}).keys())
-            if not result_pair:
-                return f"No data found for pair {pair}. It may be an invalid pair."
+    Kraken's Ticker endpoint accepts a comma-separated list of pairs, so all
+    pairs are fetched with a single request. Kraken rejects the whole request
+    when one pair is unknown; the pairs are then fetched one by one so the
+    valid ones are still returned.
+    """
 
-            ticker_data = data["result"][result_pair[0]]
-            return json.dumps(ticker_data, indent=2)
+    name: str = "Kraken Batch Ticker Information"
+    description: str = (
+        "Fetches real-time ticker information for a list of cryptocurrency pairs "
+        "from Kraken in a single call. Prefer this over the single-pair tool when "
+        "comparing several cryptocurrencies."
+    )
+    args_schema: Type[BaseModel] = BatchTickerInfoInput
+
+    def _run(self, pairs: list[str]) -> str:
+        """Execute the tool to fetch ticker data for all pairs."""
+        # Deduplicate while keeping the caller's order
+        unique_pairs = list(dict.fromkeys(pair.strip() for pair in pairs))
+        if not unique_pairs:
+            return "Error: No pairs provided."
 
-        except requests.exceptions.RequestException as e:
-            return f"Error fetching data from Kraken: {e}"
-        except json.JSONDecodeError:
-            return "Error: Failed to parse JSON response from Kraken."
+        try:
+            return _fetch_tickers(
+                ",".join(unique_pairs), int(time.time() // _TICKER_TTL)
+            )
+        except KrakenAPIError as e:
+            if len(unique_pairs) == 1:
+                return str(e)
+            logger.warning(
+                "Kraken rejected the batch request (%s); fetching %d pairs one by one",
+                e,
+                len(unique_pairs),
+            )
+            return _get_tickers_each(unique_pairs)
+        except _FETCH_ERRORS as e:
+            return _describe_error(e)
@@ -6,7 +6,7 @@ temporary API issues, rate limiting, and other transient errors that
 might cause "Invalid response from LLM call - None or empty" errors.
 """
 
-import asyncio
+import functools
 from collections.abc import Callable
 from typing import Any, Optional
 
@@ -14,10 +14,13 @@ from langchain_core.callbacks import CallbackManagerForLLMRun
 from langchain_core.language_models.llms import BaseLLM
 from langchain_core.outputs import LLMResult
 from tenacity import (
+    AsyncRetrying,
+    RetryCallState,
     Retrying,
     retry_if_exception_type,
     stop_after_attempt,
     wait_exponential,
+    wait_exponential_jitter,
 )
 
 from finwiz.tools.logger import get_logger
@@ -26,6 +29,30 @@ from finwiz.tools.logger import get_logger
 logger = get_logger(__name__)
 
 
+def _check_result(result: LLMResult | None, label: str) -> None:
+    """
+    Reject empty LLM results so that they are retried like errors.
+
+    Args:
+        result: The result returned by the underlying LLM
+        label: Name of the call used in error messages, e.g. "LLM"
+
+    Raises:
+        ValueError: If the result or any generation is empty
+
+    """
+    # Check if result is empty or None
+    if not result or not result.generations or not result.generations[0]:
+        raise ValueError(f"Empty response from {label} call")
+
+    # Additional validation to check for empty content
+    if any(
+        not gen_list or not gen_list[0].text or not gen_list[0].text.strip()
+        for gen_list in result.generations
+    ):
+        raise ValueError(f"Empty content in {label} response")
+
+
 class RetryLLMWrapper(BaseLLM):
     """
     A wrapper for LLM models that adds retry capability.
@@ -62,6 +89,25 @@ class RetryLLMWrapper(BaseLLM):
         self.factor = factor
         self.verbose = verbose
 
+        # Retry policies built once and reused by every call
+        self._retryer = Retrying(
+            stop=stop_after_attempt(max_retries),
+            wait=wait_exponential(multiplier=min_seconds, max=max_seconds),
+            retry=retry_if_exception_type(Exception),
+            before_sleep=functools.partial(self._log_retry, label="LLM"),
+            reraise=True,
+        )
+        # Jittered so that concurrent async calls do not retry in lockstep
+        self._async_retryer = AsyncRetrying(
+            stop=stop_after_attempt(max_retries),
+            wait=wait_exponential_jitter(
+                initial=min_seconds, max=max_seconds, exp_base=factor
+            ),
+            retry=retry_if_exception_type(Exception),
+            before_sleep=functools.partial(self._log_retry, label="Async LLM"),
+            reraise=True,
+        )
+
     @property
     def _llm_type(self) -> str:
         """Return the type of LLM."""
@@ -87,63 +133,53 @@ class RetryLLMWrapper(BaseLLM):
             LLMResult: The generated result from the LLM
 
         Raises:
-            RetryError: When all retry attempts fail
+            Exception: The last error once all retry attempts fail
 
         """
-        attempt = 0
-        last_exception = None
+        return self._retryer(self._generate_once, prompts, stop, run_manager, **kwargs)
 
-        # Create a retryer with exponential backoff
-        retryer = Retrying(
-            stop=stop_after_attempt(self.max_retries),
-            wait=wait_exponential(multiplier=self.min_seconds, max=self.max_seconds),
-            retry=retry_if_exception_type(Exception),
-            reraise=True,
+    def _generate_once(
+        self,
+        prompts: list[str],
+        stop: list[str] | None,
+        run_manager: CallbackManagerForLLMRun | None,
+        **kwargs: Any,
+    ) -> LLMResult:
+        """Make a single LLM call and validate its result."""
+        result = self.llm._generate(
+            prompts, stop=stop, run_manager=run_manager, **kwargs
         )
+        _check_result(result, "LLM")
+        return result
 
-        for attempt in retryer:
-            with attempt:
-                try:
-                    if self.verbose:
-                        if attempt.retry_state.attempt_number > 1:
-                            logger.warning(
-                                f"Retrying LLM call, attempt {attempt.retry_state.attempt_number}/{self.max_retries}"
-                            )
-
-                    # Call the underlying LLM
-                    result = self.llm._generate(
-                        prompts, stop=stop, run_manager=run_manager, **kwargs
-                    )
-
-                    # Check if result is empty or None
-                    if (
-                        not result
-                        or not result.generations
-                        or not result.generations[0]
-                    ):
-                        raise ValueError("Empty response from LLM call")
-
-                    # Additional validation to check for empty content
-                    for gen_list in result.generations:
-                        if (
-                            not gen_list
-                            or not gen_list[0].text
-                            or gen_list[0].text.strip() == ""
-                        ):
-                            raise ValueError("Empty content in LLM response")
-
-                    return result
-
-                except Exception as e:
-                    last_exception = e
-                    logger.warning(f"LLM call failed with error: {str(e)}. Retrying...")
-                    raise e
-
-        # This code should not be reached due to reraise=True in Retrying
-        logger.error(f"All {self.max_retries} LLM call attempts failed")
-        if last_exception:
-            raise last_exception
-        raise RuntimeError("All LLM call attempts failed")
+    async def _agenerate_once(
+        self,
+        prompts: list[str],
+        stop: list[str] | None,
+        run_manager: CallbackManagerForLLMRun | None,
+        **kwargs: Any,
+    ) -> LLMResult:
+        """Make a single async LLM call and validate its result."""
+        result = await self.llm._agenerate(
+            prompts, stop=stop, run_manager=run_manager, **kwargs
+        )
+        _check_result(result, "async LLM")
+        return result
+
+    def _log_retry(self, retry_state: RetryCallState, label: str) -> None:
+        """Log a failed attempt before tenacity waits and retries."""
+        logger.warning(
+            "%s call failed with error: %s. Retrying...",
+            label,
+            retry_state.outcome.exception(),
+        )
+        if self.verbose:
+            logger.warning(
+                "Retrying %s call, attempt %s/%s",
+                label,
+                retry_state.attempt_number + 1,
+                self.max_retries,
+            )
 
     async def _agenerate(
         self,
@@ -165,53 +201,9 @@ class RetryLLMWrapper(BaseLLM):
             LLMResult: The generated result from the LLM
 
         """
-        # Implement async retry logic similar to the sync version
-        attempt = 0
-        while attempt < self.max_retries:
-            try:
-                if self.verbose and attempt > 0:
-                    logger.warning(
-                        f"Retrying async LLM call, attempt {attempt + 1}/{self.max_retries}"
-                    )
-
-                # Call the underlying LLM
-                result = await self.llm._agenerate(
-                    prompts, stop=stop, run_manager=run_manager, **kwargs
-                )
-
-                # Check if result is empty or None
-                if not result or not result.generations or not result.generations[0]:
-                    raise ValueError("Empty response from async LLM call")
-
-                # Additional validation to check for empty content
-                for gen_list in result.generations:
-                    if (
-                        not gen_list
-                        or not gen_list[0].text
-                        or gen_list[0].text.strip() == ""
-                    ):
-                        raise ValueError("Empty content in async LLM response")
-
-                return result
-
-            except Exception as e:
-                logger.warning(
-                    f"Async LLM call failed with error: {str(e)}. Retrying..."
-                )
-                attempt += 1
-                if attempt >= self.max_retries:
-                    logger.error(
-                        f"All {self.max_retries} async LLM call attempts failed"
-                    )
-                    raise
-
-                # Exponential backoff
-                wait_time = min(
-                    self.max_seconds, self.min_seconds * (self.factor**attempt)
-                )
-                await asyncio.sleep(wait_time)
-
-        raise RuntimeError("All async LLM call attempts failed")
+        return await self._async_retryer(
+            self._agenerate_once, prompts, stop, run_manager, **kwargs
+        )
 
 
 def get_llm_with_retries(
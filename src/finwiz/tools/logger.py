@@ -19,50 +19,130 @@ Usage:
     logger.critical("Critical message")
 """
 
+import atexit
 import logging
 import os
+import queue
 import sys
-from logging.handlers import RotatingFileHandler, TimedRotatingFileHandler
+from logging.handlers import (
+    QueueHandler,
+    QueueListener,
+    RotatingFileHandler,
+    TimedRotatingFileHandler,
+)
 from pathlib import Path
 from typing import Optional
 
+# Set once handlers are installed, so repeated imports of entry-point modules
+# do not rebuild them
+_LOGGING_CONFIGURED = False
+
+# Formatters are stateless and shared by every handler that uses them
+_DATE_FORMAT = "%Y-%m-%d %H:%M:%S"
+_CONSOLE_FORMATTER = logging.Formatter(
+    "%(asctime)s - %(name)s - %(levelname)s - %(message)s", datefmt=_DATE_FORMAT
+)
+# More detailed format for file logs
+_FILE_FORMATTER = logging.Formatter(
+    "%(asctime)s - %(name)s - %(levelname)s - "
+    "[%(filename)s:%(lineno)d] - %(message)s",
+    datefmt=_DATE_FORMAT,
+)
+
+# Background listener writing the log files, so that logging calls on agent
+# threads do not block on disk I/O
+_LISTENER: QueueListener | None = None
+
+# Arguments of the last setup_logging call, replayed in forked children
+_SETUP_KWARGS: dict = {}
+
+# Forked pool workers leave through os._exit, which skips atexit, so a listener
+# started there would never be flushed; children write their files directly
+_IN_FORKED_CHILD = False
+
+
+def _stop_listener() -> None:
+    """Flush and stop the file logging listener, closing its handlers."""
+    global _LISTENER
+    if _LISTENER is None:
+        return
+    _LISTENER.stop()
+    for handler in _LISTENER.handlers:
+        handler.close()
+    _LISTENER = None
+
+
+atexit.register(_stop_listener)
+
+
+def _reinit_after_fork() -> None:
+    """Restart file logging in a forked child, where the listener is gone."""
+    global _LISTENER, _LOGGING_CONFIGURED, _IN_FORKED_CHILD
+    _IN_FORKED_CHILD = True
+    if _LISTENER is None:
+        return
+
+    # Only the forking thread survives fork, so the inherited queue would never
+    # be drained; drop the dead listener and build fresh handlers instead
+    for handler in _LISTENER.handlers:
+        handler.close()
+    _LISTENER = None
+    _LOGGING_CONFIGURED = False
+    setup_logging(**_SETUP_KWARGS)
+
+
+os.register_at_fork(after_in_child=_reinit_after_fork)
+
 
 def setup_logging(
     log_level: int = logging.INFO,
     log_to_file: bool = True,
     log_dir: str = "logs",
     app_name: str = "finwiz",
+    force: bool = False,
 ) -> None:
     """
     Set up logging configuration for the application.
 
+    The configuration is applied once per process; later calls are no-ops
+    unless `force` is set.
+
     Args:
         log_level: The logging level to use (default: logging.INFO)
         log_to_file: Whether to log to file (default: True)
         log_dir: Directory to store log files (default: "logs")
         app_name: Name of the application for log files (default: "finwiz")
+        force: Reconfigure even if logging was already set up (default: False)
 
     """
+    global _LOGGING_CONFIGURED, _LISTENER
+    if _LOGGING_CONFIGURED and not force:
+        return
+
+    _SETUP_KWARGS.update(
+        log_level=log_level, log_to_file=log_to_file, log_dir=log_dir, app_name=app_name
+    )
+
+    log_dir_path = Path(log_dir)
+
     # Create logs directory if it doesn't exist
     if log_to_file:
-        Path(log_dir).mkdir(exist_ok=True)
+        log_dir_path.mkdir(exist_ok=True)
 
     # Configure root logger
     root_logger = logging.getLogger()
     root_logger.setLevel(log_level)
 
     # Remove existing handlers to avoid duplicate logs
-    for handler in root_logger.handlers[:]:
-        root_logger.removeHandler(handler)
+    _stop_listener()
+    for handler in root_logger.handlers:
+        handler.close()
+    root_logger.handlers.clear()
 
     # Create console handler
     console_handler = logging.StreamHandler(sys.stdout)
     console_handler.setLevel(log_level)
-
-    # Create formatters
-    console_format = "%(asctime)s - %(name)s - %(levelname)s - %(message)s"
-    console_formatter = logging.Formatter(console_format, datefmt="%Y-%m-%d %H:%M:%S")
-    console_handler.setFormatter(console_formatter)
+    console_handler.setFormatter(_CONSOLE_FORMATTER)
 
     # Add console handler to root logger
     root_logger.addHandler(console_handler)
@@ -70,37 +150,43 @@ def setup_logging(
     # Add file handler if requested
     if log_to_file:
         # Daily rotating file handler
-        log_file = os.path.join(log_dir, f"{app_name}.log")
+        log_file = log_dir_path / f"{app_name}.log"
         file_handler = TimedRotatingFileHandler(
             log_file,
             when="midnight",
             backupCount=30,  # Keep logs for 30 days
         )
         file_handler.setLevel(log_level)
-
-        # More detailed format for file logs
-        file_format = (
-            "%(asctime)s - %(name)s - %(levelname)s - "
-            "[%(filename)s:%(lineno)d] - %(message)s"
-        )
-        file_formatter = logging.Formatter(file_format, datefmt="%Y-%m-%d %H:%M:%S")
-        file_handler.setFormatter(file_formatter)
-
-        # Add file handler to root logger
-        root_logger.addHandler(file_handler)
+        file_handler.setFormatter(_FILE_FORMATTER)
 
         # Create error log file handler (for ERROR and above)
-        error_log_file = os.path.join(log_dir, f"{app_name}_error.log")
+        error_log_file = log_dir_path / f"{app_name}_error.log"
         error_file_handler = RotatingFileHandler(
             error_log_file,
             maxBytes=10 * 1024 * 1024,  # 10MB
             backupCount=10,
         )
         error_file_handler.setLevel(logging.ERROR)
-        error_file_handler.setFormatter(file_formatter)
+        error_file_handler.setFormatter(_FILE_FORMATTER)
+
+        if _IN_FORKED_CHILD:
+            root_logger.addHandler(file_handler)
+            root_logger.addHandler(error_file_handler)
+            _LOGGING_CONFIGURED = True
+            return
+
+        # Route file output through a queue drained by a background thread
+        log_queue: queue.SimpleQueue = queue.SimpleQueue()
+        queue_handler = QueueHandler(log_queue)
+        queue_handler.setLevel(log_level)
+        root_logger.addHandler(queue_handler)
+
+        _LISTENER = QueueListener(
+            log_queue, file_handler, error_file_handler, respect_handler_level=True
+        )
+        _LISTENER.start()
 
-        # Add error file handler to root logger
-        root_logger.addHandler(error_file_handler)
+    _LOGGING_CONFIGURED = True
 
 
 def get_logger(name: str, log_level: Optional[int] = None) -> logging.Logger:  # noqa: UP007
@@ -5,7 +5,8 @@ This module provides tools for Retrieval Augmented Generation (RAG)
 to enable crews to store and retrieve knowledge across sessions.
 """
 
-from typing import List, Optional, Dict, Any
+import copy
+import functools
 
 from crewai_tools import RagTool
 from crewai.tools import BaseTool as Tool
@@ -13,23 +14,26 @@ from finwiz.rag_config import DEFAULT_RAG_CONFIG
 from finwiz.tools.save_to_rag_tool import SaveToRagTool
 
 
-def get_rag_tools(collection_suffix: Optional[str] = None) -> List[Tool]:
+@functools.cache
+def get_rag_tools(collection_suffix: str | None = None) -> tuple[Tool, ...]:
     """
     Get RAG tools for knowledge retrieval and storage.
 
+    Tools are built once per collection and shared by later calls, so crews
+    using the same collection reuse one embedding client and vector DB handle.
+
     Args:
         collection_suffix: Optional suffix to create crew-specific collections.
             For example, "stock" would create a "finwiz-stock" collection.
 
     Returns:
-        List of RAG tools for knowledge retrieval and storage.
+        Tuple of RAG tools for knowledge retrieval and storage.
     """
-    # Create a copy of the default config
-    config = DEFAULT_RAG_CONFIG.copy()
+    # Deep copy so the shared default config is never modified
+    config = copy.deepcopy(DEFAULT_RAG_CONFIG)
 
     # If a collection suffix is provided, create a crew-specific collection
     if collection_suffix:
-        config["vectordb"]["config"] = config["vectordb"]["config"].copy()
         config["vectordb"]["config"]["collection_name"] = f"finwiz-{collection_suffix}"
 
     # Create the RAG tool for retrieval
@@ -46,4 +50,4 @@ def get_rag_tools(collection_suffix: Optional[str] = None) -> List[Tool]:
     # Create the SaveToRag tool for storage
     save_to_rag_tool = SaveToRagTool(rag_tool=rag_tool)
 
-    return [rag_tool, save_to_rag_tool]
+    return (rag_tool, save_to_rag_tool)
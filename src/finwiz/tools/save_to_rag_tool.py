@@ -1,4 +1,5 @@
-from typing import Optional, Type, Any
+import hashlib
+from typing import Any
 
 from crewai_tools import RagTool
 from crewai.tools import BaseTool
@@ -10,21 +11,68 @@ from finwiz.rag_config import DEFAULT_RAG_CONFIG
 class SaveToRagInput(BaseModel):
     """Input schema for SaveToRagTool."""
 
-    text: str = Field(..., description="Text to store in the vector database")
+    text: str | None = Field(None, description="Text to store in the vector database")
+    texts: list[str] | None = Field(
+        None,
+        description="Several texts to store in the vector database, one document each",
+    )
 
 
 class SaveToRagTool(BaseTool):
     """Tool that saves arbitrary text into the project's RAG database."""
 
     name: str = "SaveToRag"
-    description: str = "Persist text so it can be retrieved later via the RAG tool."
-    args_schema: Type[BaseModel] = SaveToRagInput
+    description: str = (
+        "Persist text so it can be retrieved later via the RAG tool. "
+        "Pass several texts at once in `texts` to store them in one call."
+    )
+    args_schema: type[BaseModel] = SaveToRagInput
     rag_tool: Any = None  # Define rag_tool as a field
 
-    def __init__(self, rag_tool: Optional[RagTool] = None) -> None:
+    def __init__(self, rag_tool: RagTool | None = None) -> None:
         super().__init__()
         self._rag_tool = rag_tool or RagTool(config=DEFAULT_RAG_CONFIG, summarize=True)
 
-    def _run(self, text: str) -> str:
-        self._rag_tool.add(source=text, data_type="text")
+    def _run(self, text: str | None = None, texts: list[str] | None = None) -> str:
+        # Identical texts would collide on their document id, so keep one of each
+        batch = list(
+            dict.fromkeys(t for t in [text, *(texts or [])] if t and t.strip())
+        )
+        if not batch:
+            return "nothing to store"
+
+        if not self._add_batch(batch):
+            # The RAG backend exposes no vector store to batch into
+            for item in batch:
+                self._rag_tool.add(source=item, data_type="text")
         return "stored"
+
+    def _add_batch(self, batch: list[str]) -> bool:
+        """
+        Add texts to the vector store in one call, one document per text.
+
+        The collection embeds the documents of a single add together, so the
+        whole batch costs one embedding request instead of one per text.
+
+        Args:
+            batch: Texts to store
+
+        Returns:
+            bool: False when the RAG tool is not backed by an embedchain app
+
+        """
+        adapter = getattr(self._rag_tool, "adapter", None)
+        app = getattr(adapter, "embedchain_app", None)
+        if app is None:
+            return False
+
+        ids = [hashlib.sha256(item.encode("utf-8")).hexdigest() for item in batch]
+        # Same metadata embedchain records for a "text" source, so queries
+        # filtered on the app id still find these documents
+        base = {"data_type": "text", "url": "local"}
+        app_id = getattr(app.config, "id", None)
+        if app_id is not None:
+            base["app_id"] = app_id
+        metadatas = [{**base, "hash": doc_id, "doc_id": doc_id} for doc_id in ids]
+        app.db.add(documents=batch, metadatas=metadatas, ids=ids)
+        return True
@@ -6,15 +6,19 @@ This script provides functionality to periodically update the RAG knowledge base
 with fresh financial data and prune outdated information.
 """
 
+import copy
 import datetime
+import functools
 import logging
+import threading
+from concurrent.futures import ThreadPoolExecutor
 from typing import Dict, List, Optional
 
-import yfinance as yf
 from crewai_tools import RagTool
 
 from finwiz.rag_config import DEFAULT_RAG_CONFIG
 from finwiz.tools.save_to_rag_tool import SaveToRagTool
+from finwiz.utils.yf_utils import get_info
 
 # Configure logging
 logging.basicConfig(
@@ -22,6 +26,42 @@ logging.basicConfig(
 )
 logger = logging.getLogger(__name__)
 
+# Yahoo Finance requests issued concurrently by an update pass
+_MAX_CONCURRENT_REQUESTS = 8
+
+# Market data update passes and the collections they write to
+_UPDATE_PASSES = {
+    "stock": ["AAPL", "MSFT", "GOOGL", "AMZN", "META"],
+    "etf": ["SPY", "QQQ", "VTI", "ARKK", "XLF"],
+    # Crypto uses the Yahoo Finance ticker format
+    "crypto": ["BTC-USD", "ETH-USD", "SOL-USD", "ADA-USD", "DOT-USD"],
+}
+
+# Passes run concurrently but share the same Chroma store, so writes are
+# serialized
+_SAVE_LOCK = threading.Lock()
+
+
+@functools.lru_cache(maxsize=16)
+def _get_save_tool(collection_suffix: str | None = None) -> SaveToRagTool:
+    """
+    Return the SaveToRag tool for a collection, built once per suffix.
+
+    Args:
+        collection_suffix: Optional suffix for the collection name
+
+    Returns:
+        A SaveToRagTool writing to the collection.
+    """
+    # Deep copy so concurrent passes never share the nested vectordb config
+    config = copy.deepcopy(DEFAULT_RAG_CONFIG)
+    if collection_suffix:
+        config["vectordb"]["config"]["collection_name"] = f"finwiz-{collection_suffix}"
+
+    # The tool only writes the pre-formatted entries, so skip summarization
+    rag_tool = RagTool(config=config, summarize=False)
+    return SaveToRagTool(rag_tool=rag_tool)
+
 
 def update_market_data(
     tickers: List[str], collection_suffix: Optional[str] = None
@@ -33,22 +73,19 @@ def update_market_data(
         tickers: List of ticker symbols to update
         collection_suffix: Optional suffix for the collection name
     """
-    # Create RAG tools with the appropriate collection
-    config = DEFAULT_RAG_CONFIG.copy()
-    if collection_suffix:
-        config["vectordb"]["config"] = config["vectordb"]["config"].copy()
-        config["vectordb"]["config"]["collection_name"] = f"finwiz-{collection_suffix}"
-
-    rag_tool = RagTool(config=config, summarize=True)
-    save_tool = SaveToRagTool(rag_tool=rag_tool)
+    save_tool = _get_save_tool(collection_suffix)
 
     current_date = datetime.datetime.now().strftime("%Y-%m-%d")
 
-    for ticker in tickers:
+    # Each lookup is an independent request, so overlap them
+    with ThreadPoolExecutor(max_workers=_MAX_CONCURRENT_REQUESTS) as executor:
+        futures = {ticker: executor.submit(get_info, ticker) for ticker in tickers}
+
+    entries: List[str] = []
+    for ticker, future in futures.items():
         try:
             # Get latest data
-            ticker_obj = yf.Ticker(ticker)
-            info = ticker_obj.info
+            info = future.result()
 
             # Format key information
             if "shortName" in info:
@@ -66,30 +103,47 @@ def update_market_data(
                 if dividend_yield != "Unknown":
                     dividend_yield = f"{float(dividend_yield) * 100:.2f}%"
 
-                # Create knowledge entry
-                entry = f"""
-                Market Data Update for {name} ({ticker}) - {current_date}
-                
-                Current Price: {current_price}
-                Market Cap: {market_cap}
-                Sector: {sector}
-                Industry: {industry}
-                P/E Ratio: {pe_ratio}
-                Dividend Yield: {dividend_yield}
-                
-                This data was automatically collected and added to the knowledge base
-                as part of the periodic update process.
-                """
-
-                # Store in knowledge base
-                save_tool._run(entry)
-                logger.info(f"Updated knowledge base with data for {ticker}")
+                # Create knowledge entry, without the source indentation that
+                # a triple-quoted string would add to every embedded line
+                entry = "\n".join(
+                    [
+                        f"Market Data Update for {name} ({ticker}) - {current_date}",
+                        "",
+                        f"Current Price: {current_price}",
+                        f"Market Cap: {market_cap}",
+                        f"Sector: {sector}",
+                        f"Industry: {industry}",
+                        f"P/E Ratio: {pe_ratio}",
+                        f"Dividend Yield: {dividend_yield}",
+                        "",
+                        "This data was automatically collected and added to the "
+                        "knowledge base as part of the periodic update process.",
+                    ]
+                )
+
+                entries.append(entry)
 
             else:
-                logger.warning(f"Could not retrieve complete information for {ticker}")
+                logger.warning("Could not retrieve complete information for %s", ticker)
 
         except Exception as e:
-            logger.error(f"Error updating {ticker}: {str(e)}")
+            logger.error("Error updating %s: %s", ticker, e)
+
+    if not entries:
+        return
+
+    # Store the entries with one batched add; SaveToRagTool keeps each entry
+    # as its own document, so tickers are never mixed in one chunk
+    try:
+        with _SAVE_LOCK:
+            save_tool._run(texts=entries)
+        logger.info(
+            "Updated knowledge base with data for %d tickers (%s)",
+            len(entries),
+            collection_suffix or "default",
+        )
+    except Exception as e:
+        logger.error("Error saving market data to the knowledge base: %s", e)
 
 
 def prune_outdated_knowledge(
@@ -106,7 +160,8 @@ def prune_outdated_knowledge(
     # Currently, ChromaDB doesn't have a simple way to delete documents by metadata
     # This would require custom implementation with the ChromaDB API
     logger.info(
-        f"Pruning outdated knowledge (older than {max_age_days} days) is not yet implemented"
+        "Pruning outdated knowledge (older than %s days) is not yet implemented",
+        max_age_days,
     )
     logger.info("This feature will be implemented in a future version")
 
@@ -116,17 +171,19 @@ def main():
     # Example usage
     logger.info("Starting knowledge base update")
 
-    # Update stock data
-    stock_tickers = ["AAPL", "MSFT", "GOOGL", "AMZN", "META"]
-    update_market_data(stock_tickers, collection_suffix="stock")
-
-    # Update ETF data
-    etf_tickers = ["SPY", "QQQ", "VTI", "ARKK", "XLF"]
-    update_market_data(etf_tickers, collection_suffix="etf")
-
-    # Update crypto data (using Yahoo Finance format)
-    crypto_tickers = ["BTC-USD", "ETH-USD", "SOL-USD", "ADA-USD", "DOT-USD"]
-    update_market_data(crypto_tickers, collection_suffix="crypto")
+    # Build the save tools one at a time before the passes start: concurrent
+    # passes would otherwise open Chroma clients on the same directory at once
+    for suffix in _UPDATE_PASSES:
+        _get_save_tool(suffix)
+
+    # The passes only wait on the network, so run them side by side
+    with ThreadPoolExecutor(max_workers=len(_UPDATE_PASSES)) as executor:
+        futures = [
+            executor.submit(update_market_data, tickers, collection_suffix=suffix)
+            for suffix, tickers in _UPDATE_PASSES.items()
+        ]
+    for future in futures:
+        future.result()
 
     # Prune outdated knowledge
     prune_outdated_knowledge(max_age_days=30)
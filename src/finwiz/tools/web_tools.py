@@ -2,9 +2,13 @@
 Web tools for FinWiz crews.
 
 This module provides functions to get various web-based research tools
-for use by the FinWiz crews.
+for use by the FinWiz crews. Each factory builds its tools once and returns
+the same instances on later calls, so their API clients are reused.
 """
 
+import functools
+
+from crewai.tools import BaseTool
 from crewai_tools import (
     FirecrawlScrapeWebsiteTool,
     FirecrawlSearchTool,
@@ -13,50 +17,48 @@ from crewai_tools import (
 )
 
 
-def get_search_tools():
+@functools.lru_cache(maxsize=1)
+def get_search_tools() -> tuple[BaseTool, ...]:
     """
     Get web search tools.
 
     Returns:
-        list: A list of web search tool instances.
+        tuple[BaseTool, ...]: The web search tool instances.
     """
-    return [
+    return (
         SerperDevTool(n_results=25, search_type="search"),
         FirecrawlSearchTool(limit=25, save_file=True),
-    ]
+    )
 
 
-def get_news_tools():
+@functools.lru_cache(maxsize=1)
+def get_news_tools() -> tuple[BaseTool, ...]:
     """
     Get news search tools.
 
     Returns:
-        list: A list of news search tool instances.
+        tuple[BaseTool, ...]: The news search tool instances.
     """
-    return [
-        SerperDevTool(n_results=25, search_type="news"),
-    ]
+    return (SerperDevTool(n_results=25, search_type="news"),)
 
 
-def get_scrape_tools():
+@functools.lru_cache(maxsize=1)
+def get_scrape_tools() -> tuple[BaseTool, ...]:
     """
     Get web scraping tools.
 
     Returns:
-        list: A list of web scraping tool instances.
+        tuple[BaseTool, ...]: The web scraping tool instances.
     """
-    return [
-        FirecrawlScrapeWebsiteTool(limit=25, save_file=True),
-    ]
+    return (FirecrawlScrapeWebsiteTool(limit=25, save_file=True),)
 
 
-def get_youtube_tools():
+@functools.lru_cache(maxsize=1)
+def get_youtube_tools() -> tuple[BaseTool, ...]:
     """
     Get YouTube search tools.
 
     Returns:
-        list: A list of YouTube search tool instances.
+        tuple[BaseTool, ...]: The YouTube search tool instances.
     """
-    return [
-        YoutubeVideoSearchTool(),
-    ]
+    return (YoutubeVideoSearchTool(),)
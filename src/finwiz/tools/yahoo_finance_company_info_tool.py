@@ -1,10 +1,38 @@
 """
 Tool for fetching Yahoo Finance Company Information.
 """
-import yfinance as yf
 from crewai.tools import BaseTool
 from pydantic import BaseModel, Field
 
+from finwiz.utils.yf_utils import get_info, select_fields
+
+# (output key, yfinance info key) pairs for each section of the profile
+_PROFILE_FIELDS = (
+    ("name", "longName"),
+    ("industry", "industry"),
+    ("sector", "sector"),
+    ("website", "website"),
+    ("country", "country"),
+    ("employees", "fullTimeEmployees"),
+    ("business_summary", "longBusinessSummary"),
+)
+_FINANCIAL_FIELDS = (
+    ("revenue", "totalRevenue"),
+    ("profit_margin", "profitMargins"),
+    ("ebitda", "ebitda"),
+    ("debt_to_equity", "debtToEquity"),
+    ("return_on_equity", "returnOnEquity"),
+    ("revenue_growth", "revenueGrowth"),
+    ("earnings_growth", "earningsGrowth"),
+)
+_VALUATION_FIELDS = (
+    ("market_cap", "marketCap"),
+    ("pe_ratio", "trailingPE"),
+    ("forward_pe", "forwardPE"),
+    ("price_to_book", "priceToBook"),
+    ("price_to_sales", "priceToSalesTrailing12Months"),
+)
+
 
 class GetCompanyInfoInput(BaseModel):
     """Input schema for getting company information."""
@@ -30,45 +58,19 @@ class YahooFinanceCompanyInfoTool(BaseTool):
     def _run(self, ticker: str) -> dict:
         """Execute the Yahoo Finance company info lookup."""
         try:
-            ticker_data = yf.Ticker(ticker)
-            info = ticker_data.info
+            info = get_info(ticker)
+
+            # Create a focused company profile, keeping only the fields present
+            company_info = {"symbol": ticker, **select_fields(info, _PROFILE_FIELDS)}
+
+            financial_metrics = select_fields(info, _FINANCIAL_FIELDS)
+            if financial_metrics:
+                company_info["financial_metrics"] = financial_metrics
 
-            # Create a focused company profile
-            company_info = {
-                "symbol": ticker,
-                "name": info.get("longName", "N/A"),
-                "industry": info.get("industry", "N/A"),
-                "sector": info.get("sector", "N/A"),
-                "website": info.get("website", "N/A"),
-                "country": info.get("country", "N/A"),
-                "employees": info.get("fullTimeEmployees", "N/A"),
-                "business_summary": info.get("longBusinessSummary", "N/A"),
-                "financial_metrics": {
-                    "revenue": info.get("totalRevenue", "N/A"),
-                    "profit_margin": info.get("profitMargins", "N/A"),
-                    "ebitda": info.get("ebitda", "N/A"),
-                    "debt_to_equity": info.get("debtToEquity", "N/A"),
-                    "return_on_equity": info.get("returnOnEquity", "N/A"),
-                    "revenue_growth": info.get("revenueGrowth", "N/A"),
-                    "earnings_growth": info.get("earningsGrowth", "N/A"),
-                },
-                "valuation_metrics": {
-                    "market_cap": info.get("marketCap", "N/A"),
-                    "pe_ratio": info.get("trailingPE", "N/A"),
-                    "forward_pe": info.get("forwardPE", "N/A"),
-                    "price_to_book": info.get("priceToBook", "N/A"),
-                    "price_to_sales": info.get("priceToSalesTrailing12Months", "N/A"),
-                },
-            }
+            valuation_metrics = select_fields(info, _VALUATION_FIELDS)
+            if valuation_metrics:
+                company_info["valuation_metrics"] = valuation_metrics
 
-            # Clean up N/A values
-            return {
-                k:
-                v
-                if not isinstance(v, dict)
-                else {k2: v2 for k2, v2 in v.items() if v2 != "N/A"}
-                for k, v in company_info.items()
-                if v != "N/A"
-            }
+            return company_info
         except Exception as e:
             return {"error": f"Failed to get company info for {ticker}: {str(e)}"}
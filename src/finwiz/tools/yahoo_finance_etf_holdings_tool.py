@@ -1,10 +1,19 @@
 """
 Tool for fetching Yahoo Finance ETF Holdings.
 """
-import yfinance as yf
 from crewai.tools import BaseTool
 from pydantic import BaseModel, Field
 
+from finwiz.utils.yf_utils import get_info, get_ticker, select_fields
+
+# (output key, yfinance info key) pairs for the fund profile
+_ETF_FIELDS = (
+    ("name", "shortName"),
+    ("asset_class", "categoryName"),
+    ("expense_ratio", "annualReportExpenseRatio"),
+    ("aum", "totalAssets"),
+)
+
 
 class GetETFHoldingsInput(BaseModel):
     """Input schema for getting ETF holdings."""
@@ -30,10 +39,10 @@ class YahooFinanceETFHoldingsTool(BaseTool):
     def _run(self, ticker: str) -> dict:
         """Execute the Yahoo Finance ETF holdings lookup."""
         try:
-            etf_data = yf.Ticker(ticker)
+            etf_data = get_ticker(ticker)
 
             # Get basic ETF info
-            info = etf_data.info
+            info = get_info(ticker)
 
             # Get holdings if available
             holdings = []
@@ -60,16 +69,11 @@ class YahooFinanceETFHoldingsTool(BaseTool):
             except Exception:
                 pass
 
-            result = {
-                "symbol": ticker,
-                "name": info.get("shortName", "N/A"),
-                "asset_class": info.get("categoryName", "N/A"),
-                "expense_ratio": info.get("annualReportExpenseRatio", "N/A"),
-                "aum": info.get("totalAssets", "N/A"),
-                "top_holdings": holdings[:10],  # Top 10 holdings
-                "sector_breakdown": sector_data,
-            }
+            result = {"symbol": ticker, **select_fields(info, _ETF_FIELDS)}
+            if holdings:
+                result["top_holdings"] = holdings[:10]  # Top 10 holdings
+            result["sector_breakdown"] = sector_data
 
-            return {k: v for k, v in result.items() if v != "N/A" and v != []}
+            return result
         except Exception as e:
             return {"error": f"Failed to get ETF holdings for {ticker}: {str(e)}"}
@@ -1,12 +1,76 @@
 """
 Tool for fetching Yahoo Finance Ticker History.
 """
-import datetime
+from typing import TYPE_CHECKING
 
 import yfinance as yf
 from crewai.tools import BaseTool
 from pydantic import BaseModel, Field
 
+from finwiz.utils.yf_utils import (
+    cached_json,
+    get_cached_json,
+    get_ticker,
+    history_ttl,
+    set_cached_json,
+)
+
+if TYPE_CHECKING:
+    import pandas as pd
+
+_CACHE_NAMESPACE = "yahoo_finance_history"
+
+# yfinance history columns and the keys they are reported under
+_PRICE_COLUMNS = {
+    "Open": "open",
+    "High": "high",
+    "Low": "low",
+    "Close": "close",
+    "Volume": "volume",
+}
+
+
+def _cache_key(ticker: str, period: str, interval: str) -> str:
+    """Return the cache key of a price history summary."""
+    return f"{ticker.upper()}_{period}_{interval}"
+
+
+def _summarize_history(
+    history: "pd.DataFrame", ticker: str, period: str, interval: str
+) -> dict:
+    """Summarize a price history DataFrame, or return {} if it is empty."""
+    if history.empty:
+        return {}
+
+    # Only the last 10 data points are returned, so only format those
+    recent = history.tail(10)[list(_PRICE_COLUMNS)].rename(columns=_PRICE_COLUMNS)
+    recent = recent.round(2).astype({"volume": "int64"})
+    history_list = (
+        recent.rename_axis("date")
+        .reset_index()
+        .assign(date=lambda df: df["date"].dt.strftime("%Y-%m-%d"))
+        .to_dict("records")
+    )
+
+    # Add summary statistics from the first and last rows
+    earliest_close = round(float(history["Close"].iloc[0]), 2)
+    latest_close = round(float(history["Close"].iloc[-1]), 2)
+
+    summary = {
+        "symbol": ticker,
+        "period": period,
+        "interval": interval,
+        "start_date": history.index[0].strftime("%Y-%m-%d"),
+        "end_date": history.index[-1].strftime("%Y-%m-%d"),
+        "price_change": round(latest_close - earliest_close, 2),
+        "price_change_percent": round(
+            (latest_close / (earliest_close or 1) - 1) * 100, 2
+        ),
+        "data_points": len(history),
+    }
+
+    return {"summary": summary, "history": history_list}
+
 
 class GetTickerHistoryInput(BaseModel):
     """Input schema for getting ticker price history."""
@@ -23,6 +87,21 @@ class GetTickerHistoryInput(BaseModel):
     )
 
 
+class GetBatchTickerHistoryInput(BaseModel):
+    """Input schema for getting the price history of several tickers."""
+
+    tickers: list[str] = Field(
+        ..., description="The ticker symbols (e.g., ['AAPL', 'VTI', 'BTC-USD'])"
+    )
+    period: str = Field(
+        "1y", description="Valid periods: 1d,5d,1mo,3mo,6mo,1y,2y,5y,10y,ytd,max"
+    )
+    interval: str = Field(
+        "1d",
+        description="Valid intervals: 1m,2m,5m,15m,30m,60m,90m,1h,1d,5d,1wk,1mo,3mo",
+    )
+
+
 class YahooFinanceHistoryTool(BaseTool):
     """
     Get historical price data for a financial instrument from Yahoo Finance.
@@ -41,50 +120,92 @@ class YahooFinanceHistoryTool(BaseTool):
     def _run(self, ticker: str, period: str = "1y", interval: str = "1d") -> dict:
         """Execute the Yahoo Finance historical data lookup."""
         try:
-            ticker_data = yf.Ticker(ticker)
-            history = ticker_data.history(period=period, interval=interval)
+            result = cached_json(
+                _CACHE_NAMESPACE,
+                _cache_key(ticker, period, interval),
+                history_ttl(interval),
+                lambda: _summarize_history(
+                    get_ticker(ticker).history(period=period, interval=interval),
+                    ticker,
+                    period,
+                    interval,
+                ),
+            )
 
-            if history.empty:
+            if not result:
                 return {"error": f"No historical data available for {ticker}"}
+            return result
+        except Exception as e:
+            return {"error": f"Failed to get history for {ticker}: {str(e)}"}
 
-            # Format the data for easier consumption
-            history_list = []
-            for date, row in history.iterrows():
-                history_list.append(
-                    {
-                        "date": date.strftime("%Y-%m-%d"),
-                        "open": round(float(row.get("Open", 0)), 2),
-                        "high": round(float(row.get("High", 0)), 2),
-                        "low": round(float(row.get("Low", 0)), 2),
-                        "close": round(float(row.get("Close", 0)), 2),
-                        "volume": int(row.get("Volume", 0)),
-                    }
+
+class YahooFinanceBatchHistoryTool(BaseTool):
+    """
+    Get historical price data for several financial instruments at once.
+
+    Tickers missing from the cache are fetched together with `yf.download`,
+    which downloads them in parallel, and share the cache of the
+    single-ticker tool.
+    """
+
+    name: str = "Yahoo Finance Batch History Tool"
+    description: str = (
+        "Get historical price data (open, high, low, close, volume) for a list of"
+        " stocks, ETFs, or cryptocurrencies in a single call. Prefer this over the"
+        " single-ticker tool when comparing several instruments."
+    )
+    args_schema: type[BaseModel] = GetBatchTickerHistoryInput
+
+    def _run(
+        self, tickers: list[str], period: str = "1y", interval: str = "1d"
+    ) -> dict:
+        """Execute the Yahoo Finance historical data lookup for all tickers."""
+        # Deduplicate while keeping the caller's order
+        unique_tickers = list(dict.fromkeys(ticker.upper() for ticker in tickers))
+        if not unique_tickers:
+            return {"error": "No tickers provided"}
+
+        ttl = history_ttl(interval)
+        results = {
+            ticker: get_cached_json(
+                _CACHE_NAMESPACE, _cache_key(ticker, period, interval), ttl
+            )
+            for ticker in unique_tickers
+        }
+
+        missing = [ticker for ticker, result in results.items() if result is None]
+        if missing:
+            try:
+                data = yf.download(
+                    missing,
+                    period=period,
+                    interval=interval,
+                    group_by="ticker",
+                    threads=True,
+                    progress=False,
                 )
+            except Exception as e:
+                return {"error": f"Failed to get history for {missing}: {str(e)}"}
 
-            # Add summary statistics
-            latest = history_list[-1] if history_list else {}
-            earliest = history_list[0] if history_list else {}
-
-            summary = {
-                "symbol": ticker,
-                "period": period,
-                "interval": interval,
-                "start_date": earliest.get("date", "N/A"),
-                "end_date": latest.get("date", "N/A"),
-                "price_change": round(
-                    latest.get("close", 0) - earliest.get("close", 0), 2
-                ),
-                "price_change_percent": round(
-                    (latest.get("close", 0) / earliest.get("close", 1) - 1) * 100, 2
-                ),
-                "data_points": len(history_list),
-            }
-
-            return {
-                "summary": summary,
-                "history": history_list[
-                    -10:
-                ],  # Return only last 10 data points to avoid overloading
-            }
-        except Exception as e:
-            return {"error": f"Failed to get history for {ticker}: {str(e)}"}
+            for ticker in missing:
+                try:
+                    # Dates are aligned across tickers, drop the ones a
+                    # ticker did not trade on
+                    history = data.xs(ticker, axis=1, level=0).dropna(subset=["Close"])
+                    result = _summarize_history(history, ticker, period, interval)
+                except Exception as e:
+                    results[ticker] = {
+                        "error": f"Failed to get history for {ticker}: {str(e)}"
+                    }
+                    continue
+
+                if result:
+                    set_cached_json(
+                        _CACHE_NAMESPACE, _cache_key(ticker, period, interval), result
+                    )
+                results[ticker] = result
+
+        return {
+            ticker: result or {"error": f"No historical data available for {ticker}"}
+            for ticker, result in results.items()
+        }
@@ -3,10 +3,11 @@ Tool for fetching Yahoo Finance News.
 """
 import datetime
 
-import yfinance as yf
 from crewai.tools import BaseTool
 from pydantic import BaseModel, Field
 
+from finwiz.utils.yf_utils import get_news
+
 
 class GetTickerNewsInput(BaseModel):
     """Input schema for getting news for a ticker."""
@@ -33,8 +34,7 @@ class YahooFinanceNewsTool(BaseTool):
     def _run(self, ticker: str, limit: int = 5) -> str:
         """Execute the Yahoo Finance news lookup."""
         try:
-            ticker_obj = yf.Ticker(ticker)
-            news = ticker_obj.news
+            news = get_news(ticker)
 
             if not news:
                 return f"No recent news found for {ticker}."
@@ -43,7 +43,7 @@ class YahooFinanceNewsTool(BaseTool):
             news = news[:limit]
 
             # Format the news items
-            result = f"Recent news for {ticker}:\n\n"
+            lines = [f"Recent news for {ticker}:\n"]
 
             for i, item in enumerate(news, 1):
                 title = item.get("title", "No title")
@@ -58,10 +58,10 @@ class YahooFinanceNewsTool(BaseTool):
                 else:
                     published_str = "Unknown date"
 
-                result += f"{i}. {title}\n"
-                result += f"   Publisher: {publisher} | Date: {published_str}\n"
-                result += f"   Link: {link}\n\n"
+                lines.append(f"{i}. {title}")
+                lines.append(f"   Publisher: {publisher} | Date: {published_str}")
+                lines.append(f"   Link: {link}\n")
 
-            return result
+            return "\n".join(lines) + "\n"
         except Exception as e:
             return f"Error retrieving news for {ticker}: {str(e)}"
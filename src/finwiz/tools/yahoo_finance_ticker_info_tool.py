@@ -1,10 +1,27 @@
 """
 Tool for fetching Yahoo Finance Ticker Information.
 """
-import yfinance as yf
 from crewai.tools import BaseTool
 from pydantic import BaseModel, Field
 
+from finwiz.utils.yf_utils import get_info, select_fields
+
+# (output key, yfinance info key) pairs, after the symbol and current price
+_TICKER_FIELDS = (
+    ("name", "shortName"),
+    ("currency", "currency"),
+    ("previous_close", "previousClose"),
+    ("market_cap", "marketCap"),
+    ("volume", "volume"),
+    ("average_volume", "averageVolume"),
+    ("52wk_high", "fiftyTwoWeekHigh"),
+    ("52wk_low", "fiftyTwoWeekLow"),
+    ("pe_ratio", "trailingPE"),
+    ("dividend_yield", "dividendYield"),
+    ("sector", "sector"),
+    ("industry", "industry"),
+)
+
 
 class GetTickerInfoInput(BaseModel):
     """Input schema for getting ticker information."""
@@ -32,30 +49,18 @@ class YahooFinanceTickerInfoTool(BaseTool):
     def _run(self, ticker: str) -> dict:
         """Execute the Yahoo Finance ticker info lookup."""
         try:
-            ticker_data = yf.Ticker(ticker)
-            info = ticker_data.info
+            info = get_info(ticker)
 
             # Format a clean subset of the most important information
-            result = {
-                "symbol": ticker,
-                "name": info.get("shortName", "N/A"),
-                "currency": info.get("currency", "N/A"),
-                "current_price": info.get(
-                    "currentPrice", info.get("regularMarketPrice", "N/A")
-                ),
-                "previous_close": info.get("previousClose", "N/A"),
-                "market_cap": info.get("marketCap", "N/A"),
-                "volume": info.get("volume", "N/A"),
-                "average_volume": info.get("averageVolume", "N/A"),
-                "52wk_high": info.get("fiftyTwoWeekHigh", "N/A"),
-                "52wk_low": info.get("fiftyTwoWeekLow", "N/A"),
-                "pe_ratio": info.get("trailingPE", "N/A"),
-                "dividend_yield": info.get("dividendYield", "N/A"),
-                "sector": info.get("sector", "N/A"),
-                "industry": info.get("industry", "N/A"),
-            }
-
-            # Remove N/A values for cleaner output
-            return {k: v for k, v in result.items() if v != "N/A"}
+            result = {"symbol": ticker}
+
+            current_price = info.get("currentPrice")
+            if current_price is None:
+                current_price = info.get("regularMarketPrice")
+            if current_price is not None:
+                result["current_price"] = current_price
+
+            result.update(select_fields(info, _TICKER_FIELDS))
+            return result
         except Exception as e:
             return {"error": f"Failed to get ticker info for {ticker}: {str(e)}"}
@@ -2,5 +2,24 @@
 Tools for interacting with Yahoo Finance via yfinance library.
 
 This module provides CrewAI-compatible tools to access financial market data
-through the Yahoo Finance API using the yfinance library.
+through the Yahoo Finance API using the yfinance library. Each tool is defined
+once in its own module and re-exported here.
 """
+
+from finwiz.tools.yahoo_finance_company_info_tool import YahooFinanceCompanyInfoTool
+from finwiz.tools.yahoo_finance_etf_holdings_tool import YahooFinanceETFHoldingsTool
+from finwiz.tools.yahoo_finance_history_tool import (
+    YahooFinanceBatchHistoryTool,
+    YahooFinanceHistoryTool,
+)
+from finwiz.tools.yahoo_finance_news_tool import YahooFinanceNewsTool
+from finwiz.tools.yahoo_finance_ticker_info_tool import YahooFinanceTickerInfoTool
+
+__all__ = [
+    "YahooFinanceBatchHistoryTool",
+    "YahooFinanceCompanyInfoTool",
+    "YahooFinanceETFHoldingsTool",
+    "YahooFinanceHistoryTool",
+    "YahooFinanceNewsTool",
+    "YahooFinanceTickerInfoTool",
+]
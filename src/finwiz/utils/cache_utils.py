@@ -0,0 +1,70 @@
+"""
+On-disk TTL cache for FinWiz tools.
+
+This module provides a minimal file-based cache for API responses. Each entry
+is stored as a file under `cache/<namespace>/` in the project root and is
+considered fresh while its modification time is younger than the TTL given by
+the caller. Entries survive process restarts, so repeated crew runs on the
+same day do not hit rate-limited providers again.
+"""
+
+import os
+import re
+import tempfile
+import time
+from pathlib import Path
+
+# Project root is 3 levels up from this file (src/finwiz/utils)
+CACHE_DIR = Path(__file__).resolve().parents[3] / "cache"
+
+_UNSAFE_CHARS = re.compile(r"[^A-Za-z0-9_.-]")
+
+
+def _cache_file(namespace: str, key: str) -> Path:
+    """Return the file backing a cache entry."""
+    return CACHE_DIR / namespace / f"{_UNSAFE_CHARS.sub('_', key)}.json"
+
+
+def get_cached(namespace: str, key: str, ttl: float) -> str | None:
+    """
+    Read a cache entry if it exists and is younger than `ttl`.
+
+    Args:
+        namespace: Cache namespace, usually the data provider
+        key: Entry key within the namespace
+        ttl: Maximum age of the entry in seconds
+
+    Returns:
+        The cached value, or None on a miss or an expired entry.
+    """
+    path = _cache_file(namespace, key)
+    try:
+        if time.time() - path.stat().st_mtime > ttl:
+            return None
+        return path.read_text(encoding="utf-8")
+    except OSError:
+        return None
+
+
+def set_cached(namespace: str, key: str, value: str) -> None:
+    """
+    Store a cache entry.
+
+    The value is written to a temporary file and moved into place, so
+    concurrent readers never see a partially written entry.
+
+    Args:
+        namespace: Cache namespace, usually the data provider
+        key: Entry key within the namespace
+        value: Value to store
+    """
+    path = _cache_file(namespace, key)
+    path.parent.mkdir(parents=True, exist_ok=True)
+    fd, tmp_path = tempfile.mkstemp(dir=path.parent, suffix=".tmp")
+    try:
+        with os.fdopen(fd, "w", encoding="utf-8") as f:
+            f.write(value)
+        os.replace(tmp_path, path)
+    except OSError:
+        os.unlink(tmp_path)
+        raise
@@ -9,12 +9,39 @@ loading from the crew definitions and removing dependencies
 on the internal 'crewai.project.config' object.
 """
 
+import copy
+import functools
+import logging
 import os
+import pickle
+import tempfile
+from collections.abc import Iterable
 from pathlib import Path
-from typing import Any, Dict
+from typing import Any
 
 import yaml
 
+from finwiz.utils.cache_utils import CACHE_DIR
+
+logger = logging.getLogger(__name__)
+
+# The libyaml-backed loader parses several times faster; PyYAML wheels ship it,
+# but source builds without libyaml only have the pure-Python loader
+try:
+    from yaml import CSafeLoader as _YamlLoader
+except ImportError:
+    from yaml import SafeLoader as _YamlLoader
+
+# Assumes that 'crews' directory is a sibling of the 'utils' directory.
+_CREWS_PATH = Path(__file__).parent.parent / "crews"
+
+# Shared research guidelines injected into every agent backstory
+_GUIDELINES_PATH = Path(__file__).parents[3] / "docs" / "agent_handbook.md"
+
+# Opt-in on-disk cache of merged agent configs, so cold starts skip YAML parsing
+_CONFIG_CACHE_ENABLED = os.getenv("FINWIZ_CONFIG_CACHE") == "1"
+_CONFIG_CACHE_DIR = CACHE_DIR / "config"
+
 
 def _get_config_path(relative_path: str) -> Path:
     """
@@ -26,66 +53,206 @@ def _get_config_path(relative_path: str) -> Path:
 
     Returns:
         The absolute path to the configuration file.
+
+    """
+    return _CREWS_PATH / relative_path
+
+
+@functools.lru_cache(maxsize=128)
+def _parse_yaml_cached(path: str, mtime_ns: int, size: int) -> Any:
+    """
+    Parse a YAML file, memoized on its path, modification time and size.
+
+    The stat fields are only part of the cache key, so an edited file is
+    parsed again. A file holding several mapping documents is merged into a
+    single mapping, later documents overriding earlier keys. Callers must copy
+    the result before mutating it.
     """
-    # Assumes that 'crews' directory is a sibling of the 'utils' directory.
-    base_path = Path(__file__).parent.parent / "crews"
-    return base_path / relative_path
+    with open(path, "r", encoding="utf-8") as file:
+        documents = [
+            document
+            for document in yaml.load_all(file, Loader=_YamlLoader)
+            if document is not None
+        ]
+
+    if len(documents) <= 1:
+        return documents[0] if documents else None
+    if not all(isinstance(document, dict) for document in documents):
+        return documents
+
+    merged: dict[str, Any] = {}
+    for document in documents:
+        merged.update(document)
+    return merged
+
+
+@functools.lru_cache(maxsize=16)
+def _read_text_cached(path: str, mtime_ns: int, size: int) -> str:
+    """Read a text file, memoized on its path, modification time and size."""
+    with open(path, "r", encoding="utf-8") as file:
+        return file.read()
 
 
-def load_yaml_config(config_path: str) -> Dict[str, Any]:
+def _file_stamp(path: Path) -> tuple[int, int]:
+    """Return the (mtime_ns, size) of a file, used to key the caches."""
+    st = os.stat(path)
+    return st.st_mtime_ns, st.st_size
+
+
+def _read_text(path: Path) -> str:
+    """Read a text file through the stat-keyed cache."""
+    return _read_text_cached(str(path), *_file_stamp(path))
+
+
+def load_yaml_config(config_path: str) -> dict[str, Any]:
     """
     Load a generic YAML configuration file.
 
+    Parsed files are cached until their modification time or size changes,
+    and each call returns a fresh copy that is safe to modify.
+
     Args:
         config_path: The relative path to the YAML file.
 
     Returns:
         A dictionary containing the configuration.
+
+    """
+    full_path = _get_config_path(config_path)
+    try:
+        stamp = _file_stamp(full_path)
+    except FileNotFoundError as e:
+        raise FileNotFoundError(f"Config file not found at {full_path}") from e
+
+    config = _parse_yaml_cached(str(full_path), *stamp)
+    if not isinstance(config, dict) or not config:
+        raise ValueError(
+            f"Config file at {full_path} is empty or not a valid dictionary."
+        )
+    # Callers mutate the config, so never hand out the cached object
+    return copy.deepcopy(config)
+
+
+@functools.lru_cache(maxsize=32)
+def _merge_guidelines_cached(
+    config_path: str,
+    config_stamp: tuple[int, int],
+    guidelines_stamp: tuple[int, int],
+) -> dict[str, Any]:
+    """
+    Build an agent configuration with the guidelines injected, memoized.
+
+    The stamps are the (mtime_ns, size) of the agent YAML and the guidelines
+    file. With FINWIZ_CONFIG_CACHE=1 the result is also pickled under the
+    cache directory and reused by later processes while the stamps match.
+    Callers must copy the result before mutating it.
     """
+    stamps = (config_stamp, guidelines_stamp)
+    cache_file = _CONFIG_CACHE_DIR / f"{config_path.replace('/', '_')}.pkl"
+    if _CONFIG_CACHE_ENABLED:
+        cached = _load_pickled(cache_file, stamps)
+        if cached is not None:
+            return cached
+
+    # Load the agent configurations
+    agents_config = load_yaml_config(config_path)
+
+    # Read the shared guidelines
+    guidelines = _read_text(_GUIDELINES_PATH)
+
+    # Inject guidelines into each agent's backstory
+    suffix = f"\n\n{guidelines}"
+    for agent_config in agents_config.values():
+        if "backstory" in agent_config:
+            agent_config["backstory"] += suffix
+        else:
+            agent_config["backstory"] = guidelines
+
+    if _CONFIG_CACHE_ENABLED:
+        _store_pickled(cache_file, stamps, agents_config)
+    return agents_config
+
+
+def _load_pickled(cache_file: Path, stamps: tuple) -> dict[str, Any] | None:
+    """Return a pickled config if it was built from files with these stamps."""
+    try:
+        with open(cache_file, "rb") as file:
+            cached_stamps, config = pickle.load(file)
+    except FileNotFoundError:
+        return None
+    except (OSError, pickle.UnpicklingError, EOFError, ValueError) as e:
+        logger.warning("Ignoring unreadable config cache %s: %s", cache_file, e)
+        return None
+    return config if cached_stamps == stamps else None
+
+
+def _store_pickled(cache_file: Path, stamps: tuple, config: dict[str, Any]) -> None:
+    """Pickle a config with its source stamps, replacing the file atomically."""
+    try:
+        cache_file.parent.mkdir(parents=True, exist_ok=True)
+        fd, tmp_path = tempfile.mkstemp(dir=cache_file.parent, suffix=".tmp")
+        try:
+            with os.fdopen(fd, "wb") as file:
+                pickle.dump((stamps, config), file, protocol=5)
+            os.replace(tmp_path, cache_file)
+        except BaseException:
+            os.unlink(tmp_path)
+            raise
+    except OSError as e:
+        logger.warning("Failed to write config cache %s: %s", cache_file, e)
+
+
+def _load_with_guidelines_stamp(
+    config_path: str, guidelines_stamp: tuple[int, int]
+) -> dict[str, Any]:
+    """Return a copy of the merged agent config for a known handbook stamp."""
     full_path = _get_config_path(config_path)
     try:
-        with open(full_path, "r", encoding="utf-8") as file:
-            config = yaml.safe_load(file)
-            if not isinstance(config, dict) or not config:
-                raise ValueError(
-                    f"Config file at {full_path} is empty or not a valid dictionary."
-                )
-            return config
+        config_stamp = _file_stamp(full_path)
     except FileNotFoundError as e:
         raise FileNotFoundError(f"Config file not found at {full_path}") from e
 
+    merged = _merge_guidelines_cached(config_path, config_stamp, guidelines_stamp)
+    return copy.deepcopy(merged)
 
-def load_config_with_guidelines(config_path: str) -> Dict[str, Any]:
+
+def load_config_with_guidelines(config_path: str) -> dict[str, Any]:
     """
     Load an agent YAML configuration and inject shared guidelines.
 
     This function reads a specified agent YAML file, injects the common
     research guidelines from 'configs/guidelines.md' into the 'backstory'
-    of each agent, and returns the modified configuration.
+    of each agent, and returns the modified configuration. The merged
+    configuration is cached until either file changes.
 
     Args:
         config_path: The relative path to the agent configuration YAML file.
 
     Returns:
         A dictionary containing the agent configurations with guidelines injected.
+
     """
-    # Load the agent configurations
-    agents_config = load_yaml_config(config_path)
+    return _load_with_guidelines_stamp(config_path, _file_stamp(_GUIDELINES_PATH))
 
-    # Construct the path to the guidelines file
-    guidelines_path = (
-        Path(__file__).parent.parent.parent.parent / "docs" / "agent_handbook.md"
-    )
 
-    # Read the shared guidelines
-    with open(guidelines_path, "r", encoding="utf-8") as file:
-        guidelines = file.read()
+def load_all_configs_with_guidelines(
+    config_paths: Iterable[str],
+) -> dict[str, dict[str, Any]]:
+    """
+    Load several agent YAML configurations and inject shared guidelines.
 
-    # Inject guidelines into each agent's backstory
-    for agent_name in agents_config.keys():
-        if "backstory" in agents_config[agent_name]:
-            agents_config[agent_name]["backstory"] += f"\n\n{guidelines}"
-        else:
-            agents_config[agent_name]["backstory"] = guidelines
+    Equivalent to calling `load_config_with_guidelines` for each path, but
+    the guidelines file is checked once for the whole batch.
 
-    return agents_config
+    Args:
+        config_paths: The relative paths to the agent configuration YAML files.
+
+    Returns:
+        A dictionary mapping each path to its agent configurations.
+
+    """
+    guidelines_stamp = _file_stamp(_GUIDELINES_PATH)
+    return {
+        config_path: _load_with_guidelines_stamp(config_path, guidelines_stamp)
+        for config_path in config_paths
+    }
@@ -5,25 +5,178 @@ This module provides utility functions for flow management, including
 output directory handling, caching, and result persistence.
 """
 
+import functools
 import logging
 import os
-from typing import Any, Dict, Optional
+import threading
+import uuid
+from collections.abc import Iterable
+from concurrent.futures import Future, ThreadPoolExecutor
+from datetime import datetime
+from pathlib import Path
+from typing import Any
+
+import orjson
 
 # Set up logging
 logger = logging.getLogger(__name__)
 
+# Only full_date needs strftime (month names); the ISO forms come from
+# isoformat(), which does not parse a format string
+_FULL_DATE_FORMAT = "%B %d, %Y"
+
+# Project root is 3 levels up from this file (src/finwiz/utils); the path never
+# changes during a run, so it is resolved once
+_OUTPUT_DIR = str(Path(__file__).resolve().parents[3] / "output" / "report")
+
+# Result files are written in the background so the flow does not wait on disk;
+# pending writes are flushed by the executor's exit handler at shutdown
+_WRITE_EXECUTOR = ThreadPoolExecutor(max_workers=2, thread_name_prefix="finwiz-write")
+
+# Output directories already created by this process
+_OUTPUT_DIRS_READY: set[str] = set()
+
+# Serializes result assignments when crews share a state object across threads
+_STATE_LOCK = threading.Lock()
+
+# Background writes not yet finished, by target path, so a later call waits for
+# the file instead of rerunning the crew
+_PENDING_WRITES: dict[str, Future] = {}
+_PENDING_LOCK = threading.Lock()
+
+
+def build_flow_inputs(now: datetime | None = None) -> dict[str, Any]:
+    """
+    Build the date inputs interpolated into the crew task templates.
+
+    Args:
+        now: Reference time (default: the current local time)
+
+    Returns:
+        dict[str, Any]: Inputs to pass to a crew kickoff
+
+    """
+    today = now or datetime.now()
+    timestamp = today.isoformat(sep=" ", timespec="seconds")
+    return {
+        "current_day": today.day,
+        "current_month": today.month,
+        "current_year": today.year,
+        "current_date": timestamp[:10],
+        "full_date": today.strftime(_FULL_DATE_FORMAT),
+        "timestamp": timestamp,
+    }
+
+
+def get_output_dir() -> str:
+    """
+    Return the path to the output directory.
+
+    Returns:
+        str: Path to the output directory
+
+    """
+    return _OUTPUT_DIR
 
-# def get_output_dir() -> str:
-#     """
-#     Return the path to the output directory.
 
-#     Returns:
-#         str: Path to the output directory
-#     """
-#     project_root = os.path.dirname(
-#         os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
-#     )
-#     return os.path.join(project_root, "output", "report")
+def _write_result(json_file: str, result_raw: str) -> None:
+    """
+    Persist a crew result atomically, compacting it first when it is valid JSON.
+
+    Args:
+        json_file: Path of the cache file to write
+        result_raw: Raw crew output
+
+    """
+    try:
+        data = orjson.dumps(orjson.loads(result_raw))
+    except orjson.JSONDecodeError:
+        # Not JSON (e.g. Markdown output): store it verbatim
+        data = result_raw.encode("utf-8")
+
+    # Write to a temporary file and move it into place, so a reader never sees
+    # a partially written result. The bytes go straight to the descriptor
+    # instead of through a buffered text wrapper. Unlike mkstemp, which always
+    # uses 0600, opening with 0o666 lets the umask set the usual file mode.
+    tmp_path = f"{json_file}.{uuid.uuid4().hex}.tmp"
+    fd = os.open(tmp_path, os.O_CREAT | os.O_EXCL | os.O_WRONLY, 0o666)
+    try:
+        try:
+            view = memoryview(data)
+            while view:
+                view = view[os.write(fd, view) :]
+        finally:
+            os.close(fd)
+        os.replace(tmp_path, json_file)
+    except BaseException:
+        os.unlink(tmp_path)
+        raise
+
+
+def _log_write_failure(future: Future) -> None:
+    """Log a background result write that failed."""
+    error = future.exception()
+    if error is not None:
+        logger.error("Failed to save crew results: %s", error)
+
+
+def _wait_for_pending_write(json_file: str) -> None:
+    """
+    Wait for a background write of a cache file started by this process.
+
+    Args:
+        json_file: Path of the cache file about to be read
+
+    """
+    with _PENDING_LOCK:
+        future = _PENDING_WRITES.get(json_file)
+    if future is not None:
+        # exception() blocks until the write is done without re-raising;
+        # failures are already logged by _log_write_failure
+        future.exception()
+
+
+def _submit_write(json_file: str, result_raw: str) -> None:
+    """
+    Write a crew result in the background, tracking it until it finishes.
+
+    Args:
+        json_file: Path of the cache file to write
+        result_raw: Raw crew output
+
+    """
+    future = _WRITE_EXECUTOR.submit(_write_result, json_file, result_raw)
+    with _PENDING_LOCK:
+        _PENDING_WRITES[json_file] = future
+
+    def _done(done: Future) -> None:
+        with _PENDING_LOCK:
+            if _PENDING_WRITES.get(json_file) is done:
+                del _PENDING_WRITES[json_file]
+        _log_write_failure(done)
+
+    future.add_done_callback(_done)
+
+
+@functools.lru_cache(maxsize=64)
+def _read_result(json_file: str, mtime_ns: int, size: int) -> str:
+    """
+    Read a cached crew result, memoized on its path, modification time and size.
+
+    Args:
+        json_file: Path of the cache file to read
+        mtime_ns: Modification time of the file, part of the cache key
+        size: Size of the file in bytes
+
+    Returns:
+        str: The file content
+
+    """
+    fd = os.open(json_file, os.O_RDONLY)
+    try:
+        return os.read(fd, size).decode("utf-8")
+    finally:
+        os.close(fd)
 
 
 def run_crew_with_caching(
@@ -31,10 +184,13 @@ def run_crew_with_caching(
     output_filename: str,
     state_key: str,
     state: Any,
-    inputs: Dict[str, Any],
+    inputs: dict[str, Any],
 ) -> None:
     """
-    Run a crew with caching, or load from cache if results exist.
+    Run a crew with caching, or reuse results that already exist.
+
+    Results already set on the state are kept as they are; otherwise they are
+    loaded from the cache file, and the crew only runs when neither exists.
 
     Args:
         crew_class: The crew class to instantiate and run
@@ -42,41 +198,101 @@ def run_crew_with_caching(
         state_key: Key in the state object to store results
         state: State object to update with results
         inputs: Input parameters for the crew
+
     """
-    output_dir = get_output_dir()
+    # Resolve how results are read and stored on the state once for all paths
+    if isinstance(state, dict):
+        existing = state.get(state_key)
+        store = state.__setitem__
+    else:
+        existing = getattr(state, state_key, None)
+        store = functools.partial(setattr, state)
+
+    # An earlier step of the flow already produced this result
+    if existing:
+        logger.info("Reusing %s results already in the flow state", state_key)
+        return
+
+    def set_result(key: str, value: str) -> None:
+        with _STATE_LOCK:
+            store(key, value)
+
+    output_dir = _OUTPUT_DIR
     json_file = os.path.join(output_dir, output_filename)
 
-    if os.path.exists(json_file):
-        logger.info(f"Found existing analysis results at {json_file}")
+    # A result computed earlier in this process may still be on its way to disk
+    _wait_for_pending_write(json_file)
+
+    # A single stat both checks for a cached result and sizes the read
+    try:
+        st = os.stat(json_file)
+    except FileNotFoundError:
+        st = None
+
+    if st is not None:
+        logger.info("Found existing analysis results at %s", json_file)
         try:
-            with open(json_file, "r") as f:
-                result_raw = f.read()
-            if isinstance(state, dict):
-                state[state_key] = result_raw
-            else:
-                setattr(state, state_key, result_raw)
-            logger.info(f"Loaded existing {state_key} results successfully")
+            result_raw = _read_result(json_file, st.st_mtime_ns, st.st_size)
+            set_result(state_key, result_raw)
+            logger.info("Loaded existing %s results successfully", state_key)
             return
         except Exception as e:
             logger.warning(
-                f"Failed to load existing {state_key} results: {e}. Will run analysis."
+                "Failed to load existing %s results: %s. Will run analysis.",
+                state_key,
+                e,
             )
 
-    logger.info(f"Starting {crew_class.__name__} analysis")
+    logger.info("Starting %s analysis", crew_class.__name__)
     try:
         result = crew_class().crew().kickoff(inputs=inputs)
-        logger.info(f"{crew_class.__name__} analysis completed successfully")
+        logger.info("%s analysis completed successfully", crew_class.__name__)
         result_raw = result.raw
 
-        if isinstance(state, dict):
-            state[state_key] = result_raw
-        else:
-            setattr(state, state_key, result_raw)
+        set_result(state_key, result_raw)
 
-        os.makedirs(output_dir, exist_ok=True)
-        with open(json_file, "w") as f:
-            f.write(result_raw)
-        logger.debug(f"Saved {state_key} results to {json_file}")
+        if output_dir not in _OUTPUT_DIRS_READY:
+            os.makedirs(output_dir, exist_ok=True)
+            _OUTPUT_DIRS_READY.add(output_dir)
+        _submit_write(json_file, result_raw)
+        logger.debug("Saving %s results to %s", state_key, json_file)
     except Exception as e:
-        logger.error(f"Error in {state_key} analysis: {e}", exc_info=True)
+        logger.error("Error in %s analysis: %s", state_key, e, exc_info=True)
         raise
+
+
+def run_crews_parallel(
+    crew_specs: Iterable[tuple[Any, str, str]],
+    state: Any,
+    inputs: dict[str, Any],
+    max_workers: int = 8,
+) -> None:
+    """
+    Run several crews concurrently with `run_crew_with_caching`.
+
+    Crew kickoffs mostly wait on LLM calls, so running them in threads
+    overlaps that latency. Errors from any crew are raised once all crews
+    have finished.
+
+    Args:
+        crew_specs: (crew_class, output_filename, state_key) for each crew
+        state: State object shared by the crews to store their results
+        inputs: Input parameters for the crews
+        max_workers: Maximum number of crews running at the same time
+
+    """
+    with ThreadPoolExecutor(max_workers=max_workers) as executor:
+        futures = [
+            executor.submit(
+                run_crew_with_caching,
+                crew_class,
+                output_filename,
+                state_key,
+                state,
+                inputs,
+            )
+            for crew_class, output_filename, state_key in crew_specs
+        ]
+
+    for future in futures:
+        future.result()
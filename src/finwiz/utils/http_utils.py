@@ -0,0 +1,69 @@
+"""
+HTTP utilities for FinWiz tools.
+
+This module provides a factory for `requests` sessions shared by the API
+tools. A session keeps connections alive between calls, so repeated lookups
+against the same provider skip the TCP and TLS handshakes, and transient
+failures are retried by urllib3 with exponential backoff.
+"""
+
+import random
+
+import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+
+# Connect / read timeouts in seconds
+DEFAULT_TIMEOUT = (3.05, 10)
+
+# Status codes worth retrying: rate limiting and transient server errors
+RETRY_STATUS_CODES = (429, 500, 502, 503, 504)
+
+
+class FullJitterRetry(Retry):
+    """
+    Retry policy that sleeps a random time up to the exponential backoff.
+
+    urllib3's backoff is deterministic, so clients throttled at the same time
+    retry in lockstep. Drawing the delay uniformly from zero to the backoff
+    ("full jitter") spreads those retries out. A Retry-After header sent by
+    the server still takes precedence.
+    """
+
+    def get_backoff_time(self) -> float:
+        """Return a random delay between zero and the exponential backoff."""
+        return random.uniform(0, super().get_backoff_time())
+
+
+def create_session(
+    pool_maxsize: int = 32,
+    total_retries: int = 3,
+    backoff_factor: float = 0.5,
+    full_jitter: bool = False,
+) -> requests.Session:
+    """
+    Create a pooled `requests.Session` with automatic retries.
+
+    Args:
+        pool_maxsize: Maximum number of connections kept per host
+        total_retries: Maximum number of retries for a single request
+        backoff_factor: Backoff factor for the delay between retries
+        full_jitter: Randomize the delay between retries with FullJitterRetry
+
+    Returns:
+        A configured `requests.Session`.
+    """
+    retry_class = FullJitterRetry if full_jitter else Retry
+    retry = retry_class(
+        total=total_retries,
+        backoff_factor=backoff_factor,
+        status_forcelist=RETRY_STATUS_CODES,
+        allowed_methods=["GET"],
+        respect_retry_after_header=True,
+    )
+    adapter = HTTPAdapter(pool_maxsize=pool_maxsize, max_retries=retry)
+
+    session = requests.Session()
+    session.mount("https://", adapter)
+    session.mount("http://", adapter)
+    return session
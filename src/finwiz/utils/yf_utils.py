@@ -0,0 +1,226 @@
+"""
+Yahoo Finance utilities for FinWiz.
+
+This module provides cached access to the Yahoo Finance data shared by the
+yfinance tools. Results are stored with `finwiz.utils.cache_utils`, so agents
+asking for the same ticker again within the TTL do not hit Yahoo Finance,
+which rate-limits aggressive clients with HTTP 429 responses.
+"""
+
+import functools
+import logging
+import random
+import threading
+import time
+from collections.abc import Callable, Iterable
+from typing import Any, TypeVar
+
+import orjson
+import yfinance as yf
+from yfinance.exceptions import YFRateLimitError
+
+from finwiz.utils.cache_utils import get_cached, set_cached
+
+# Set up logging
+logger = logging.getLogger(__name__)
+
+# Cache lifetimes in seconds
+INFO_TTL = 60 * 60
+NEWS_TTL = 60 * 60
+HISTORY_TTL = 24 * 60 * 60
+# Intraday bars keep moving during the session
+INTRADAY_HISTORY_TTL = 60 * 60
+# Lifetime of a shared Ticker object, which holds on to its info and news
+TICKER_TTL = min(INFO_TTL, NEWS_TTL)
+
+# Attempts per lookup when Yahoo Finance answers with HTTP 429
+RATE_LIMIT_ATTEMPTS = 3
+
+# Monotonic time before which no thread should call Yahoo Finance, pushed back
+# on every 429 so concurrent lookups back off together instead of piling on
+_rate_limited_until = 0.0
+_RATE_LIMIT_LOCK = threading.Lock()
+
+T = TypeVar("T")
+
+
+def call_with_backoff(fetch: Callable[[], T]) -> T:
+    """
+    Call a yfinance lookup, backing off with jitter when rate-limited.
+
+    A rate-limit error pauses every lookup made through this function for an
+    exponentially growing, jittered delay, then the call is retried.
+
+    Args:
+        fetch: The yfinance lookup to run
+
+    Returns:
+        The result of `fetch`.
+
+    Raises:
+        YFRateLimitError: If the last attempt is still rate-limited.
+    """
+    global _rate_limited_until
+
+    for attempt in range(RATE_LIMIT_ATTEMPTS):
+        with _RATE_LIMIT_LOCK:
+            delay = _rate_limited_until - time.monotonic()
+        if delay > 0:
+            time.sleep(delay)
+
+        try:
+            return fetch()
+        except YFRateLimitError:
+            if attempt == RATE_LIMIT_ATTEMPTS - 1:
+                raise
+            backoff = 2**attempt + random.random()
+            logger.warning(
+                "Yahoo Finance rate limit hit, backing off %.1fs (attempt %d/%d)",
+                backoff,
+                attempt + 1,
+                RATE_LIMIT_ATTEMPTS,
+            )
+            with _RATE_LIMIT_LOCK:
+                _rate_limited_until = max(
+                    _rate_limited_until, time.monotonic() + backoff
+                )
+
+
+def get_cached_json(namespace: str, key: str, ttl: float) -> Any:
+    """
+    Return a cached JSON value, or None on a miss or an expired entry.
+
+    Args:
+        namespace: Cache namespace
+        key: Entry key within the namespace
+        ttl: How long a cached value stays valid, in seconds
+
+    Returns:
+        The cached value, or None.
+    """
+    cached = get_cached(namespace, key, ttl)
+    return None if cached is None else orjson.loads(cached)
+
+
+def set_cached_json(namespace: str, key: str, value: Any) -> None:
+    """
+    Cache a JSON-serializable value, logging instead of raising on failure.
+
+    Args:
+        namespace: Cache namespace
+        key: Entry key within the namespace
+        value: Value to store
+    """
+    try:
+        payload = orjson.dumps(value, default=str, option=orjson.OPT_SERIALIZE_NUMPY)
+        set_cached(namespace, key, payload.decode("utf-8"))
+    except (OSError, TypeError) as e:
+        logger.warning("Failed to cache %s entry for %s: %s", namespace, key, e)
+
+
+def cached_json(namespace: str, key: str, ttl: float, fetch: Callable[[], Any]) -> Any:
+    """
+    Return a JSON-serializable value from the cache, or fetch and cache it.
+
+    `fetch` is retried through `call_with_backoff` when rate-limited. Empty
+    values are returned without being cached, and other exceptions raised by
+    `fetch` propagate, so failed lookups are retried on the next call.
+
+    Args:
+        namespace: Cache namespace
+        key: Entry key within the namespace
+        ttl: How long a cached value stays valid, in seconds
+        fetch: Called on a cache miss to produce the value
+
+    Returns:
+        The cached or freshly fetched value.
+    """
+    cached = get_cached_json(namespace, key, ttl)
+    if cached is not None:
+        return cached
+
+    value = call_with_backoff(fetch)
+    if value:
+        set_cached_json(namespace, key, value)
+    return value
+
+
+@functools.lru_cache(maxsize=128)
+def _get_ticker(symbol: str, bucket: int) -> yf.Ticker:
+    """Return the `yf.Ticker` for a symbol, memoized per TTL bucket."""
+    return yf.Ticker(symbol)
+
+
+def get_ticker(symbol: str) -> yf.Ticker:
+    """
+    Return a shared `yf.Ticker` for a symbol.
+
+    yfinance caches fetched info and news on the Ticker object, so an instance
+    is only reused for `TICKER_TTL`; after that a fresh one is built and the
+    data is fetched again. Use `_get_ticker.cache_clear()` to drop all
+    instances.
+
+    Args:
+        symbol: The ticker symbol
+
+    Returns:
+        The `yf.Ticker` for the symbol.
+    """
+    return _get_ticker(symbol, int(time.time() // TICKER_TTL))
+
+
+def get_info(ticker: str) -> dict:
+    """
+    Return the Yahoo Finance info for a ticker, cached for `INFO_TTL`.
+
+    Args:
+        ticker: The ticker symbol
+
+    Returns:
+        The info dict returned by yfinance.
+    """
+    return cached_json(
+        "yahoo_finance_info", ticker.upper(), INFO_TTL, lambda: get_ticker(ticker).info
+    )
+
+
+def get_news(ticker: str) -> list:
+    """
+    Return the Yahoo Finance news for a ticker, cached for `NEWS_TTL`.
+
+    Args:
+        ticker: The ticker symbol
+
+    Returns:
+        The news items returned by yfinance.
+    """
+    return cached_json(
+        "yahoo_finance_news", ticker.upper(), NEWS_TTL, lambda: get_ticker(ticker).news
+    )
+
+
+def select_fields(info: dict, fields: Iterable[tuple[str, str]]) -> dict:
+    """
+    Copy the fields present in a yfinance info dict under new keys.
+
+    Fields that are missing or None are left out, so callers do not have to
+    strip placeholders afterwards.
+
+    Args:
+        info: The info dict returned by yfinance
+        fields: (output key, info key) pairs, in output order
+
+    Returns:
+        A dict of the present fields.
+    """
+    selected = {}
+    for key, source in fields:
+        value = info.get(source)
+        if value is not None:
+            selected[key] = value
+    return selected
+
+
+def history_ttl(interval: str) -> float:
+    """Return the cache lifetime for price history at the given interval."""
+    return INTRADAY_HISTORY_TTL if interval.endswith(("m", "h")) else HISTORY_TTL
@@ -1,13 +1,13 @@
 import logging
 import os
 import warnings
-from datetime import datetime
 
 from dotenv import load_dotenv
 
 from finwiz.crews.stock_crew.stock_crew import StockCrew
 from finwiz.tools.crewai_retry_patch import initialize_retry_mechanism
 from finwiz.tools.logger import get_logger, setup_logging
+from finwiz.utils.flow_utils import build_flow_inputs
 
 # Setup logging configuration
 log_dir = os.path.join(os.path.dirname(os.path.abspath(__file__)), "logs")
@@ -30,16 +30,8 @@ def run_test():
     logger.info("Starting single crew validation run for StockCrew.")
     try:
         # Prepare inputs
-        today = datetime.now()
-        inputs = {
-            "current_day": today.day,
-            "current_month": today.month,
-            "current_year": today.year,
-            "current_date": today.strftime("%Y-%m-%d"),
-            "full_date": today.strftime("%B %d, %Y"),
-            "timestamp": today.strftime("%Y-%m-%d %H:%M:%S"),
-        }
-        logger.debug(f"Test inputs prepared: {inputs}")
+        inputs = build_flow_inputs()
+        logger.debug("Test inputs prepared: %s", inputs)
 
         # Instantiate and run the StockCrew
         stock_crew_instance = StockCrew().crew()
@@ -51,7 +43,7 @@ def run_test():
         print("-------------------------")
 
     except Exception as e:
-        logger.critical(f"Single crew validation failed: {str(e)}", exc_info=True)
+        logger.critical("Single crew validation failed: %s", e, exc_info=True)
         raise
 
 if __name__ == "__main__":